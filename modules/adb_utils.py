@@ -6,15 +6,44 @@ operations, including device detection, app launching, and screen interaction.
 """
 
 import os
+import queue
 import re
 import subprocess
 import time
 import sys
 import shutil
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from PIL import Image
 
+# Precompiled pattern for parsing `wm size` output
+_SIZE_RE = re.compile(r'(\d+)x(\d+)')
+
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# Seconds between attempts to reopen a persistent shell that has gone away
+_SHELL_RETRY_DELAY = 5.0
+
+# Subprocess flags to hide console windows on Windows
+if sys.platform.startswith('win'):
+	_SUB_FLAGS = {'creationflags': subprocess.CREATE_NO_WINDOW}
+else:
+	_SUB_FLAGS = {}
+
+def _pump_lines(stream, lines):
+	"""Copy lines from a pipe into a queue, ending with b"" at end of file."""
+	try:
+		for line in iter(stream.readline, b""):
+			lines.put(line)
+	except (OSError, ValueError):
+		pass
+	lines.put(b"")
+
 class ADBUtility:
+	# Set once adb has been found and the server started in this process
+	_adb_verified = False
+	
 	def __init__(self, logger=None):
 		"""Initialize the ADB utility.
 		
@@ -23,25 +52,228 @@ class ADBUtility:
 		"""
 		self.logger = logger or (lambda msg: print(msg))
 		self.selected_device = None
+		self._adb_prefix = ("adb",)
 		self.screen_width = 1080  # Default
 		self.screen_height = 1920  # Default
 		
-		# Setup subprocess flags to hide console windows on Windows
-		self.subprocess_flags = {}
-		if sys.platform.startswith('win'):
-			self.subprocess_flags['creationflags'] = 0x08000000  # CREATE_NO_WINDOW flag
+		# Shell commands deferred until the next batched invocation; the
+		# screenshot and pattern threads both use the queue
+		self._pending_shell_cmds = []
+		self._pending_lock = threading.Lock()
+		
+		# Per-device results that don't change during a session
+		self._dims_cache = {}
+		self._pkg_cache = {}
+		
+		# Persistent `adb shell` session for low-latency commands
+		self._shell = None
+		self._shell_output = None  # Queue of output lines from the shell
+		self._shell_lock = threading.Lock()
+		self._shell_retry_at = 0.0  # time.monotonic() of the next reopen attempt
+		self._shell_fallback = False  # Whether input is going through one-off shells
+		
+		# Shared subprocess flags (hide console windows on Windows)
+		self.subprocess_flags = _SUB_FLAGS
+		if _SUB_FLAGS:
 			self.log("Configured for Windows - hiding command windows")
 	
 	def log(self, message):
 		"""Log a message using the provided logger function."""
 		self.logger(message)
 	
+	def _adb(self, *args, text=True, timeout=10, capture=True):
+		"""Run an adb command against the selected device.
+		
+		Args:
+			*args: Arguments following `adb -s DEVICE`
+			text: Decode output as text
+			timeout: Timeout in seconds, or None to wait indefinitely
+			capture: Capture output; discard it when False
+			
+		Returns:
+			subprocess.CompletedProcess: The result of the adb invocation
+		"""
+		if capture:
+			output = {'capture_output': True}
+		else:
+			output = {'stdout': subprocess.DEVNULL, 'stderr': subprocess.DEVNULL}
+		
+		return subprocess.run(
+			self._adb_prefix + args,
+			text=text,
+			timeout=timeout,
+			**output,
+			**self.subprocess_flags
+		)
+	
+	def run_shell_batch(self, cmds, timeout=10, capture=True):
+		"""Run several shell commands in a single `adb shell` invocation.
+		
+		Any deferred commands (such as cleanup from a previous screenshot) are
+		run first, so they piggyback on this call instead of spawning their own.
+		
+		Args:
+			cmds: List of shell command strings
+			timeout: Optional timeout in seconds
+			capture: Capture output; discard it when False
+			
+		Returns:
+			subprocess.CompletedProcess: The result of the adb invocation
+		"""
+		cmds = self._take_pending(cmds)
+		return self._adb("shell", "; ".join(cmds), timeout=timeout, capture=capture)
+	
+	def _take_pending(self, cmds):
+		"""Return cmds prefixed with any deferred shell commands, clearing the queue."""
+		with self._pending_lock:
+			cmds = self._pending_shell_cmds + list(cmds)
+			self._pending_shell_cmds = []
+		return cmds
+	
+	def _defer_shell_cmd(self, cmd):
+		"""Queue a shell command to run with the next batched invocation."""
+		with self._pending_lock:
+			self._pending_shell_cmds.append(cmd)
+	
+	def _open_shell(self):
+		"""Start a persistent shell session on the selected device.
+		
+		The caller must hold _shell_lock.
+		"""
+		self._close_shell()
+		try:
+			self._shell = subprocess.Popen(
+				self._adb_prefix + ("shell",),
+				stdin=subprocess.PIPE,
+				stdout=subprocess.PIPE,
+				stderr=subprocess.STDOUT,
+				bufsize=0,
+				**self.subprocess_flags
+			)
+		except (subprocess.SubprocessError, OSError) as e:
+			self.log(f"Could not open persistent shell: {str(e)}")
+			self._shell = None
+			return
+		
+		# Read output on a thread so _send can stop waiting at a deadline
+		self._shell_output = queue.Queue()
+		threading.Thread(
+			target=_pump_lines, args=(self._shell.stdout, self._shell_output), daemon=True
+		).start()
+	
+	def _send(self, cmd, timeout=10):
+		"""Run a command in the persistent shell and wait for it to finish.
+		
+		A shell that fails is killed, since it may still be running the command.
+		A shell that has gone away is reopened, at most once every
+		_SHELL_RETRY_DELAY seconds.
+		
+		Args:
+			cmd: Shell command string
+			timeout: Seconds to wait for the command to finish
+			
+		Returns:
+			int: Exit status of the command
+			
+		Raises:
+			subprocess.TimeoutExpired: If the command doesn't finish in time
+			subprocess.SubprocessError: If the shell is not running or exits
+			OSError: If the command can't be written to the shell
+		"""
+		with self._shell_lock:
+			if self._shell is None or self._shell.poll() is not None:
+				if time.monotonic() < self._shell_retry_at:
+					raise subprocess.SubprocessError("Persistent shell is not running")
+				self._shell_retry_at = time.monotonic() + _SHELL_RETRY_DELAY
+				self._open_shell()
+				if self._shell is None:
+					raise subprocess.SubprocessError("Persistent shell is not running")
+			
+			shell, output = self._shell, self._shell_output
+			deadline = time.monotonic() + timeout
+			try:
+				shell.stdin.write(f"{cmd}; echo __DONE_$?__\n".encode())
+				while True:
+					try:
+						line = output.get(timeout=max(0, deadline - time.monotonic()))
+					except queue.Empty:
+						raise subprocess.TimeoutExpired(cmd, timeout) from None
+					if not line:
+						raise subprocess.SubprocessError("Persistent shell closed unexpectedly")
+					if line.startswith(b"__DONE_"):
+						return int(line.strip()[7:-2] or 0)
+			except (subprocess.SubprocessError, OSError):
+				# Discard this shell while still holding the lock, so a shell
+				# reopened by another thread is never the one closed
+				self._shell = None
+				shell.kill()
+				raise
+	
+	def _shell_status(self, cmd, timeout=10):
+		"""Run a shell command and return its exit status.
+		
+		The persistent shell is used when it is available, otherwise a one-off
+		`adb shell` invocation.
+		
+		Args:
+			cmd: Shell command string
+			timeout: Timeout in seconds
+			
+		Returns:
+			int: Exit status of the command
+			
+		Raises:
+			subprocess.SubprocessError: If the command doesn't finish in time
+		"""
+		try:
+			return self._send(cmd, timeout=timeout)
+		except subprocess.TimeoutExpired:
+			raise
+		except (subprocess.SubprocessError, OSError):
+			return self._adb("shell", cmd, timeout=timeout, capture=False).returncode
+	
+	def close(self):
+		"""Close the persistent shell session, if any."""
+		with self._shell_lock:
+			self._close_shell()
+	
+	def _close_shell(self):
+		"""Close the persistent shell session; the caller must hold _shell_lock."""
+		shell, self._shell = self._shell, None
+		if shell is None:
+			return
+		
+		try:
+			shell.stdin.write(b"exit\n")
+			shell.stdin.close()
+			shell.wait(timeout=1)
+		except (subprocess.SubprocessError, OSError):
+			shell.kill()
+	
+	def invalidate_cache(self, device_id=None):
+		"""Forget cached screen dimensions and package lookups.
+		
+		Args:
+			device_id: Only clear entries for this device, or all devices if None
+		"""
+		if device_id is None:
+			self._dims_cache.clear()
+			self._pkg_cache.clear()
+			return
+		
+		self._dims_cache.pop(device_id, None)
+		for key in [k for k in self._pkg_cache if k[0] == device_id]:
+			del self._pkg_cache[key]
+	
 	def ensure_adb_running(self):
 		"""Make sure ADB server is running.
 		
 		Returns:
 			bool: True if ADB is running, False otherwise
 		"""
+		if ADBUtility._adb_verified:
+			return True
+		
 		self.log("Ensuring ADB server is running...")
 		
 		# Check if ADB is in PATH
@@ -53,8 +285,9 @@ class ADBUtility:
 			return False
 		
 		# Start ADB server if it's not running
-		result = subprocess.run(["adb", "start-server"], capture_output=True, text=True, **self.subprocess_flags)
+		subprocess.run(["adb", "start-server"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, **self.subprocess_flags)
 		self.log("ADB server started")
+		ADBUtility._adb_verified = True
 		return True
 	
 	def find_devices(self):
@@ -66,11 +299,14 @@ class ADBUtility:
 		"""
 		self.log("Looking for connected Android devices...")
 		
+		# A fresh scan may pick up reconnected or different devices
+		self.invalidate_cache()
+		
 		result = subprocess.run(["adb", "devices", "-l"], capture_output=True, text=True, **self.subprocess_flags)
 		self.log(result.stdout)
 		
 		# Parse the output to get device list
-		lines = result.stdout.strip().split('\n')
+		lines = result.stdout.splitlines()
 		if len(lines) <= 1:
 			self.log("No devices found. Make sure your device is connected.")
 			return []
@@ -78,15 +314,15 @@ class ADBUtility:
 		# Skip the first line which is the header
 		devices = []
 		for line in lines[1:]:
-			if line.strip():
-				# Example line: "emulator-5554 device product:sdk_gphone_x86 model:Android_SDK_built_for_x86 device:generic_x86"
-				# or: "127.0.0.1:5555 device"
-				parts = line.strip().split()
-				if len(parts) >= 2 and parts[1] == 'device':
-					device_id = parts[0]
-					is_network = ':' in device_id
-					display_name = f"{device_id} ({'Network' if is_network else 'Local'})"
-					devices.append((device_id, display_name))
+			# Example line: "emulator-5554 device product:sdk_gphone_x86 model:Android_SDK_built_for_x86 device:generic_x86"
+			# or: "127.0.0.1:5555 device"
+			# Split off just the id and state; the id/state separator may be spaces or a tab
+			parts = line.split(None, 2)
+			if len(parts) >= 2 and parts[1] == 'device':
+				device_id = parts[0]
+				is_network = ':' in device_id
+				display_name = f"{device_id} ({'Network' if is_network else 'Local'})"
+				devices.append((device_id, display_name))
 		
 		if not devices:
 			self.log("No available devices found.")
@@ -94,6 +330,53 @@ class ADBUtility:
 			
 		return devices
 	
+	def probe_devices(self, devices, search_term="petcube"):
+		"""Query screen size and matching packages for several devices at once.
+		
+		ADB calls are I/O bound, so each device is probed on its own thread.
+		Screen dimensions found here are cached for get_screen_dimensions.
+		
+		Args:
+			devices: List of tuples (device_id, display_name) from find_devices
+			search_term: Term to search for packages
+			
+		Returns:
+			list: List of dicts with device_id, screen_size and packages keys
+		"""
+		if not devices:
+			return []
+		
+		with ThreadPoolExecutor(max_workers=len(devices)) as executor:
+			return list(executor.map(lambda d: self._probe_one(d[0], search_term), devices))
+	
+	def _probe_one(self, device_id, search_term):
+		"""Probe a single device without touching the selected device."""
+		try:
+			result = subprocess.run(
+				["adb", "-s", device_id, "shell", f"wm size; pm list packages {search_term}"],
+				capture_output=True,
+				text=True,
+				timeout=10,
+				**self.subprocess_flags
+			)
+		except subprocess.SubprocessError as e:
+			self.log(f"Error probing {device_id}: {str(e)}")
+			return {'device_id': device_id, 'screen_size': None, 'packages': []}
+		
+		screen_size = None
+		size_match = _SIZE_RE.search(result.stdout)
+		if size_match:
+			screen_size = (int(size_match.group(1)), int(size_match.group(2)))
+			self._dims_cache[device_id] = screen_size
+		
+		packages = []
+		for line in result.stdout.splitlines():
+			line = line.strip()
+			if line.startswith('package:'):
+				packages.append(line[8:])
+		
+		return {'device_id': device_id, 'screen_size': screen_size, 'packages': packages}
+	
 	def set_active_device(self, device_id):
 		"""Set the active device for ADB commands.
 		
@@ -104,13 +387,18 @@ class ADBUtility:
 			bool: True if device was set successfully
 		"""
 		self.selected_device = device_id
+		self._adb_prefix = ("adb", "-s", device_id)
 		self.log(f"Selected device: {self.selected_device}")
 		
 		# Set the device as active
 		if ":" in self.selected_device:  # Network device
-			subprocess.run(["adb", "connect", self.selected_device], capture_output=True, **self.subprocess_flags)
+			subprocess.run(["adb", "connect", self.selected_device], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, **self.subprocess_flags)
+		
+		self._adb("wait-for-device", timeout=None, capture=False)
 		
-		subprocess.run(["adb", "-s", self.selected_device, "wait-for-device"], capture_output=True, **self.subprocess_flags)
+		# Keep a shell open so taps don't pay for a new adb process each time
+		with self._shell_lock:
+			self._open_shell()
 		return True
 	
 	def verify_package(self, package_name, search_term="petcube"):
@@ -127,23 +415,25 @@ class ADBUtility:
 			self.log("Error: No device selected. Please select a device first.")
 			return None
 			
+		cache_key = (self.selected_device, package_name, search_term)
+		if cache_key in self._pkg_cache:
+			return self._pkg_cache[cache_key]
+		
 		self.log(f"Verifying package name on device {self.selected_device}...")
 		
 		# Look for packages containing the search term
-		result = subprocess.run(
-			["adb", "-s", self.selected_device, "shell", "pm", "list", "packages", search_term],
-			capture_output=True,
-			text=True,
-			**self.subprocess_flags
-		)
+		try:
+			result = self._adb("shell", "pm", "list", "packages", search_term)
+		except subprocess.SubprocessError as e:
+			self.log(f"Error listing packages: {str(e)}")
+			return None
 		
 		packages = []
-		for line in result.stdout.strip().split('\n'):
-			if line.strip():
-				# Extract package name from 'package:com.example.app'
-				match = re.search(r'package:(.*)', line)
-				if match:
-					packages.append(match.group(1))
+		for line in result.stdout.splitlines():
+			# Extract package name from 'package:com.example.app'
+			line = line.strip()
+			if line.startswith('package:'):
+				packages.append(line[8:])
 		
 		if not packages:
 			self.log(f"Warning: No packages found containing '{search_term}'.")
@@ -159,6 +449,7 @@ class ADBUtility:
 			self.log(f"Found alternative package: {verified_package}")
 			self.log(f"Using this instead of default: {package_name}")
 		
+		self._pkg_cache[cache_key] = verified_package
 		return verified_package
 	
 	def launch_app(self, package_name):
@@ -177,12 +468,11 @@ class ADBUtility:
 		self.log(f"Starting app with package: {package_name}...")
 		
 		# Launch the app
-		result = subprocess.run(
-			["adb", "-s", self.selected_device, "shell", "monkey", "-p", package_name, "1"],
-			capture_output=True,
-			text=True,
-			**self.subprocess_flags
-		)
+		try:
+			result = self._adb("shell", "monkey", "-p", package_name, "1")
+		except subprocess.SubprocessError as e:
+			self.log(f"Failed to start app: {str(e)}")
+			return False
 		
 		# Check if app launch was successful
 		if "No activities found to run" in result.stdout:
@@ -191,8 +481,22 @@ class ADBUtility:
 			
 		self.log("App launched successfully")
 		
-		# Wait for app UI to stabilize
-		time.sleep(2)
+		# Wait (up to 2 seconds) for the app to take window focus; grep's exit
+		# status says whether it has, so the check can use the persistent shell.
+		# The deadline only decides whether to start another check: each check
+		# gets at least a second, since timing one out kills the shared shell
+		focus_check = f"dumpsys window | grep mCurrentFocus | grep -qF {package_name}"
+		deadline = time.monotonic() + 2.0
+		while True:
+			remaining = deadline - time.monotonic()
+			if remaining <= 0:
+				break
+			try:
+				if self._shell_status(focus_check, timeout=max(remaining, 1.0)) == 0:
+					break
+			except subprocess.SubprocessError:
+				break
+			time.sleep(min(0.1, max(0, deadline - time.monotonic())))
 		return True
 	
 	def get_screen_dimensions(self):
@@ -203,31 +507,69 @@ class ADBUtility:
 		"""
 		if not self.selected_device:
 			return None
+		
+		if self.selected_device in self._dims_cache:
+			self.screen_width, self.screen_height = self._dims_cache[self.selected_device]
+			return self._dims_cache[self.selected_device]
 			
-		result = subprocess.run(
-			["adb", "-s", self.selected_device, "shell", "wm", "size"],
-			capture_output=True,
-			text=True,
-			**self.subprocess_flags
-		)
+		try:
+			result = self._adb("shell", "wm", "size")
+		except subprocess.SubprocessError as e:
+			self.log(f"Error reading screen dimensions: {str(e)}")
+			return None
 		
 		# Parse dimensions (example output: "Physical size: 1080x2340")
-		size_match = re.search(r'(\d+)x(\d+)', result.stdout)
+		size_match = _SIZE_RE.search(result.stdout)
 		if size_match:
 			self.screen_width = int(size_match.group(1))
 			self.screen_height = int(size_match.group(2))
 			
 			self.log(f"Screen dimensions: {self.screen_width}x{self.screen_height}")
+			self._dims_cache[self.selected_device] = (self.screen_width, self.screen_height)
 			return (self.screen_width, self.screen_height)
 		else:
 			self.log("Could not determine screen dimensions. Using defaults.")
 			return None
 	
-	def get_screenshot(self, filename):
+	def _validate_png(self, path):
+		"""Check that a file holds a complete PNG image.
+		
+		Only the signature and trailing IEND chunk are inspected; a full PIL
+		verify is done only when that quick check fails.
+		
+		Args:
+			path: Path to the image file
+			
+		Raises:
+			Exception: If the file is not a valid PNG
+		"""
+		with open(path, "rb") as fh:
+			head = fh.read(8)
+			fh.seek(0, os.SEEK_END)
+			fh.seek(max(0, fh.tell() - 12))
+			tail = fh.read(12)
+		
+		if head == _PNG_SIGNATURE and b'IEND' in tail:
+			return
+		
+		img = Image.open(path)
+		img.verify()
+	
+	def _move_into_place(self, src, dst):
+		"""Move a finished file to its destination, renaming when possible."""
+		try:
+			os.replace(src, dst)
+		except OSError:
+			# Different filesystems, fall back to copy + delete
+			shutil.move(src, dst)
+	
+	def get_screenshot(self, filename, exec_out=True):
 		"""Take a screenshot of the device.
 		
 		Args:
 			filename: The filename to save the screenshot
+			exec_out: Try streaming the screenshot with exec-out first; pass False
+				when get_screenshot_data has just failed
 			
 		Returns:
 			bool: True if screenshot was taken successfully
@@ -238,75 +580,47 @@ class ADBUtility:
 			self.log("Error: No device selected for screenshot.")
 			return False
 		
+		# Method 1: Stream exec-out straight into memory (preferred method)
+		if exec_out:
+			try:
+				screenshot_data = self.get_screenshot_data()
+				if screenshot_data:
+					with open(filename, "wb") as f:
+						f.write(screenshot_data)
+					self.log("Screenshot successful with direct exec-out method")
+					return True
+			except Exception as e:
+				self.log(f"Method 1 exception: {str(e)}")
+				# Continue to fallback method
+		
 		try:
-			# Create a temp directory for our operations
+			# Create a temp directory for the pulled file
 			with tempfile.TemporaryDirectory() as temp_dir:
 				temp_file = os.path.join(temp_dir, "temp_screen.png")
 				
-				# Method 1: Use exec-out directly to local file (preferred method)
-				try:
-					with open(temp_file, "wb") as f:
-						process = subprocess.Popen(
-							["adb", "-s", self.selected_device, "exec-out", "screencap", "-p"],
-							stdout=f,
-							stderr=subprocess.PIPE,
-							**self.subprocess_flags
-						)
-						_, stderr = process.communicate()
-						
-						if process.returncode != 0:
-							self.log(f"Method 1 failed: {stderr.decode() if stderr else 'Unknown error'}")
-							raise subprocess.SubprocessError("Screenshot failed with exec-out")
-				
-					# Validate the image
-					try:
-						img = Image.open(temp_file)
-						img.verify()
-						self.log("Screenshot successful with direct exec-out method")
-						shutil.copy2(temp_file, filename)
-						return True
-					except Exception as e:
-						self.log(f"Invalid image from exec-out method: {str(e)}")
-						# Continue to fallback method
-				except Exception as e:
-					self.log(f"Method 1 exception: {str(e)}")
-					# Continue to fallback method
-				
 				# Method 2: Traditional screencap to device then pull
 				try:
 					self.log("Trying fallback screenshot method...")
 					# Take screenshot on device
-					result1 = subprocess.run(
-						["adb", "-s", self.selected_device, "shell", "screencap", "-p", "/sdcard/screen.png"],
-						capture_output=True,
-						timeout=5,
-						**self.subprocess_flags
-					)
+					self.run_shell_batch(["screencap -p /sdcard/screen.png"], timeout=5, capture=False)
 					
-					# Give it a moment to complete
-					time.sleep(0.5)
+					# Wait (up to 0.5 seconds) for the file to be written
+					for _ in range(5):
+						if "ok" in self.run_shell_batch(["test -s /sdcard/screen.png && echo ok"], timeout=5).stdout:
+							break
+						time.sleep(0.1)
 					
 					# Pull the file
-					result2 = subprocess.run(
-						["adb", "-s", self.selected_device, "pull", "/sdcard/screen.png", temp_file],
-						capture_output=True,
-						timeout=5,
-						**self.subprocess_flags
-					)
+					self._adb("pull", "/sdcard/screen.png", temp_file, timeout=5, capture=False)
 					
-					# Clean up
-					subprocess.run(
-						["adb", "-s", self.selected_device, "shell", "rm", "/sdcard/screen.png"],
-						capture_output=True,
-						**self.subprocess_flags
-					)
+					# Clean up alongside the next shell command
+					self._defer_shell_cmd("rm -f /sdcard/screen.png")
 					
 					# Validate image
 					try:
-						img = Image.open(temp_file)
-						img.verify()
+						self._validate_png(temp_file)
 						self.log("Screenshot successful with traditional method")
-						shutil.copy2(temp_file, filename)
+						self._move_into_place(temp_file, filename)
 						return True
 					except Exception as e:
 						self.log(f"Invalid image from traditional method: {str(e)}")
@@ -316,17 +630,9 @@ class ADBUtility:
 					raise Exception("All screenshot methods failed")
 					
 		except Exception as e:
+			# Report the failure so callers skip this frame
 			self.log(f"Error taking screenshot: {str(e)}")
-			
-			# Create a dummy image if all methods fail
-			try:
-				self.log("Creating dummy image as fallback...")
-				dummy_img = Image.new('RGB', (self.screen_width, self.screen_height), color=(0, 0, 0))
-				dummy_img.save(filename)
-				return True
-			except Exception as e2:
-				self.log(f"Failed to create dummy image: {str(e2)}")
-				return False
+			return False
 	
 	def get_screenshot_data(self):
 		"""Take a screenshot and return the image data.
@@ -343,7 +649,7 @@ class ADBUtility:
 		try:
 			# Use exec-out to get screenshot data directly
 			process = subprocess.Popen(
-				["adb", "-s", self.selected_device, "exec-out", "screencap", "-p"],
+				self._adb_prefix + ("exec-out", "screencap", "-p"),
 				stdout=subprocess.PIPE,
 				stderr=subprocess.PIPE,
 				**self.subprocess_flags
@@ -385,12 +691,75 @@ class ADBUtility:
 			return False
 		
 		try:
-			subprocess.run(
-				["adb", "-s", self.selected_device, "shell", "input", "tap", str(x), str(y)],
-				capture_output=True,
-				**self.subprocess_flags
-			)
+			self._run_input([f"input tap {x} {y}"])
+			return True
+		except subprocess.SubprocessError as e:
+			self.log(f"Error tapping screen: {str(e)}")
+			return False
+	
+	def tap_sequence(self, steps):
+		"""Run a timed sequence of taps as one shell script on the device.
+		
+		Args:
+			steps: List of (x, y, delay, hold) tuples, where delay is the
+				number of seconds to pause after the tap and hold is how long
+				to press for (0 for a plain tap). x and y may be None for a
+				pause without a tap.
+			
+		Returns:
+			bool: True if the sequence was executed successfully
+		"""
+		if not self.selected_device:
+			self.log("Error: No device selected.")
+			return False
+		
+		cmds = []
+		total_delay = 0
+		for x, y, delay, hold in steps:
+			if x is not None:
+				if hold > 0:
+					# A swipe that doesn't move is a long press
+					cmds.append(f"input swipe {x} {y} {x} {y} {round(hold * 1000)}")
+					total_delay += hold
+				else:
+					cmds.append(f"input tap {x} {y}")
+			if delay > 0:
+				cmds.append(f"sleep {delay:.3f}")
+				total_delay += delay
+		
+		if not cmds:
+			return True
+		
+		try:
+			self._run_input(cmds, timeout=total_delay + 10)
 			return True
 		except subprocess.SubprocessError as e:
 			self.log(f"Error tapping screen: {str(e)}")
 			return False
+	
+	def _run_input(self, cmds, timeout=10):
+		"""Run input commands on the persistent shell, or a one-off shell if it's gone.
+		
+		Args:
+			cmds: List of shell command strings
+			timeout: Timeout in seconds
+			
+		Raises:
+			subprocess.SubprocessError: If the fallback invocation fails
+		"""
+		# Take the deferred commands once, so the fallback still runs them
+		script = "; ".join(self._take_pending(cmds))
+		try:
+			self._send(script, timeout=timeout)
+			self._shell_fallback = False
+			return
+		except subprocess.TimeoutExpired:
+			# The script may have partly run, so don't send it again
+			raise
+		except (subprocess.SubprocessError, OSError) as e:
+			# Persistent shell unavailable, fall back to a one-off invocation
+			if not self._shell_fallback:
+				self.log(f"Persistent shell unavailable ({str(e)}), using one-off adb shell calls")
+				self._shell_fallback = True
+		
+		self._adb("shell", script, timeout=timeout, capture=False)
@@ -6,7 +6,24 @@ managing safe zone configuration.
 """
 
 import os
-import json
+
+# Prefer orjson for faster (de)serialization when it is installed
+try:
+	import orjson
+	
+	def _loads(data):
+		return orjson.loads(data)
+	
+	def _dumps(obj):
+		return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+	import json
+	
+	def _loads(data):
+		return json.loads(data)
+	
+	def _dumps(obj):
+		return json.dumps(obj, indent=2, ensure_ascii=False).encode()
 
 class ConfigManager:
 	def __init__(self, logger=None):
@@ -30,6 +47,12 @@ class ConfigManager:
 			'default_time_unit_ms': 1000,  # 1 second
 		}
 		
+		# Whether settings differ from what is on disk
+		self._dirty = True
+		
+		# Pixel safe zones keyed by screen size and zone percentages
+		self._safe_zone_cache = {}
+		
 		# Load saved settings if available
 		self.load_settings()
 	
@@ -44,16 +67,16 @@ class ConfigManager:
 			dict: The loaded settings
 		"""
 		try:
-			if os.path.exists(self.config_file):
-				with open(self.config_file, 'r') as f:
-					saved_settings = json.load(f)
-					
-					# Update settings with saved values
-					for key, value in saved_settings.items():
-						if key in self.settings:
-							self.settings[key] = value
-							
-					self.log(f"Loaded settings from {self.config_file}")
+			with open(self.config_file, 'rb') as f:
+				saved_settings = _loads(f.read())
+				
+				# Update settings with saved values for known keys
+				self.settings.update({k: saved_settings[k] for k in saved_settings.keys() & self.settings.keys()})
+				
+				self._dirty = False
+				self.log(f"Loaded settings from {self.config_file}")
+		except FileNotFoundError:
+			pass
 		except Exception as e:
 			self.log(f"Error loading settings: {str(e)}")
 		
@@ -65,16 +88,34 @@ class ConfigManager:
 		Returns:
 			bool: True if settings were saved successfully
 		"""
+		if not self._dirty:
+			return True
+		
 		try:
-			with open(self.config_file, 'w') as f:
-				json.dump(self.settings, f, indent=4)
-				
+			# Write to a temp file and swap it in so a crash can't leave a partial file
+			tmp_file = self.config_file + ".tmp"
+			with open(tmp_file, 'wb') as f:
+				f.write(_dumps(self.settings))
+			os.replace(tmp_file, self.config_file)
+			
+			self._dirty = False
 			self.log("Settings saved successfully")
 			return True
 		except Exception as e:
 			self.log(f"Error saving settings: {str(e)}")
 			return False
 	
+	def set_setting(self, key, value):
+		"""Set a single setting, marking settings as changed if it differs.
+		
+		Args:
+			key: The setting name
+			value: The new value
+		"""
+		if self.settings.get(key) != value:
+			self.settings[key] = value
+			self._dirty = True
+	
 	def update_safe_zone(self, min_x, max_x, min_y, max_y):
 		"""Update the safe zone settings.
 		
@@ -105,6 +146,8 @@ class ConfigManager:
 			'min_y': min_y,
 			'max_y': max_y,
 		}
+		self._dirty = True
+		self._safe_zone_cache.clear()
 		
 		self.log(f"Safe zone updated: X={min_x:.2f}-{max_x:.2f}, Y={min_y:.2f}-{max_y:.2f}")
 		return True
@@ -120,11 +163,17 @@ class ConfigManager:
 			dict: Safe zone boundaries in pixels
 		"""
 		zone_pct = self.settings['safe_zone_pct']
+		key = (screen_width, screen_height) + tuple(zone_pct.values())
+		safe_zone = self._safe_zone_cache.get(key)
+		if safe_zone is not None:
+			return safe_zone
+		
 		safe_zone = {
 			'min_x': int(screen_width * zone_pct['min_x']),
 			'max_x': int(screen_width * zone_pct['max_x']),
 			'min_y': int(screen_height * zone_pct['min_y']),
 			'max_y': int(screen_height * zone_pct['max_y']),
 		}
+		self._safe_zone_cache[key] = safe_zone
 		
 		return safe_zone
@@ -6,6 +6,7 @@ touch patterns using the new time-unit based pattern system.
 """
 
 import random
+from functools import partial
 from patterns import PATTERN_CLASSES
 
 
@@ -20,16 +21,20 @@ class PatternExecutor:
         """
         self.adb = adb_utility
         self.logger = logger or (lambda msg: print(msg))
-        self.safe_zone = {
+        self.enforce_safe_zone = True
+        self.set_safe_zone({
             'min_x': 0,
             'max_x': 1080,
             'min_y': 0,
             'max_y': 960,
-        }
-        self.enforce_safe_zone = True
+        })
         
         # Pattern settings
         self.time_unit_ms = 1000  # Default 1 second per time unit
+        self.pattern_active = False
+        
+        # Per-tap log messages; clear this to skip formatting and logging them
+        self.log_enabled = True
         
         # Cat detection integration
         self.cat_detector = cat_detector
@@ -39,6 +44,10 @@ class PatternExecutor:
             # Import here to avoid circular imports
             from modules.vision.cat_patterns import CatReactivePatterns
             self.cat_reactive_patterns = CatReactivePatterns(self, self.cat_detector, logger)
+        
+        # Pattern name -> callable taking intensity
+        self._dispatch = {}
+        self._build_dispatch()
     
     def log(self, message):
         """Log a message using the provided logger function."""
@@ -51,6 +60,10 @@ class PatternExecutor:
             safe_zone: Dictionary with min_x, max_x, min_y, max_y keys
         """
         self.safe_zone = safe_zone
+        
+        # Cache the bounds so clamping doesn't go through the dict on every tap
+        self._sz_minx, self._sz_maxx = safe_zone['min_x'], safe_zone['max_x']
+        self._sz_miny, self._sz_maxy = safe_zone['min_y'], safe_zone['max_y']
     
     def set_time_unit(self, milliseconds):
         """Set the duration of one time unit for patterns.
@@ -69,32 +82,64 @@ class PatternExecutor:
         """
         self.enforce_safe_zone = enabled
     
-    def execute_tap(self, x, y, log_message=None):
+    def execute_tap(self, x, y, log_fmt=None, *log_args):
         """Execute a tap with safe zone enforcement.
         
         Args:
             x: X coordinate
             y: Y coordinate
-            log_message: Optional message to log with the tap
+            log_fmt: Optional %-style message to log with the tap
+            *log_args: Arguments for log_fmt, only formatted if logging is enabled
             
         Returns:
             bool: True if tap was executed successfully
         """
         # Apply safe zone if enabled
         if self.enforce_safe_zone:
-            # Keep x within horizontal bounds
-            x = max(self.safe_zone['min_x'], min(x, self.safe_zone['max_x']))
-            y = max(self.safe_zone['min_y'], min(y, self.safe_zone['max_y']))
+            min_x, max_x = self._sz_minx, self._sz_maxx
+            min_y, max_y = self._sz_miny, self._sz_maxy
+            x = min_x if x < min_x else (max_x if x > max_x else x)
+            y = min_y if y < min_y else (max_y if y > max_y else y)
         
         # Log the tap if message provided
-        if log_message:
-            self.log(f"{log_message}: ({x}, {y})")
+        if log_fmt is not None and self.log_enabled:
+            self.log(f"{log_fmt % log_args}: ({x}, {y})")
         
         # Execute the tap
         success = self.adb.tap_screen(x, y)
         
         return success
     
+    def execute_tap_sequence(self, steps, clamp=True):
+        """Execute a timed sequence of taps with safe zone enforcement.
+        
+        The whole sequence is sent to the device at once, so there is a single
+        ADB round-trip per sequence instead of one per tap.
+        
+        Args:
+            steps: List of (x, y, delay, hold) tuples, where delay and hold
+                are in seconds. x and y may be None for a pause without a tap.
+            clamp: Whether to clamp the taps to the safe zone. Callers that
+                already know every tap is inside it can pass False.
+            
+        Returns:
+            bool: True if the sequence was executed successfully
+        """
+        if clamp and self.enforce_safe_zone:
+            min_x, max_x = self._sz_minx, self._sz_maxx
+            min_y, max_y = self._sz_miny, self._sz_maxy
+            steps = [
+                (x, y, delay, hold) if x is None else (
+                    min_x if x < min_x else (max_x if x > max_x else x),
+                    min_y if y < min_y else (max_y if y > max_y else y),
+                    delay,
+                    hold,
+                )
+                for x, y, delay, hold in steps
+            ]
+        
+        return self.adb.tap_sequence(steps)
+    
     def get_safe_coordinates(self):
         """Get a random point within the safe zone.
         
@@ -102,8 +147,8 @@ class PatternExecutor:
             tuple: (x, y) coordinates
         """
         # Generate random coordinates within safe zone
-        x = random.randint(self.safe_zone['min_x'], self.safe_zone['max_x'])
-        y = random.randint(self.safe_zone['min_y'], self.safe_zone['max_y'])
+        x = random.randint(self._sz_minx, self._sz_maxx)
+        y = random.randint(self._sz_miny, self._sz_maxy)
         
         return x, y
     
@@ -118,29 +163,57 @@ class PatternExecutor:
         """
         self.log(f"Executing {pattern_type} pattern...")
         
+        handler = self._dispatch.get(pattern_type)
+        if handler is None:
+            self.log(f"Unknown pattern type: {pattern_type}")
+            return False
+        
+        self.pattern_active = True
         try:
-            # Check if it's a cat-reactive pattern
-            if pattern_type in ["Cat Following", "Cat Teasing", "Cat Enrichment"] and self.cat_reactive_patterns:
-                if pattern_type == "Cat Following":
-                    self.cat_reactive_patterns.execute_cat_following_pattern(0.5)
-                elif pattern_type == "Cat Teasing":
-                    self.cat_reactive_patterns.execute_cat_teasing_pattern(0.5)
-                elif pattern_type == "Cat Enrichment":
-                    self.cat_reactive_patterns.execute_cat_enrichment_pattern(0.5)
-            elif pattern_type in PATTERN_CLASSES:
-                # Create and execute the pattern
-                pattern_class = PATTERN_CLASSES[pattern_type]
-                pattern = pattern_class(self, self.time_unit_ms)
-                pattern.execute(0.5)
-            else:
-                self.log(f"Unknown pattern type: {pattern_type}")
-                return False
-            
+            handler(0.5)
             return True
         except Exception as e:
             self.log(f"Error executing pattern: {str(e)}")
             return False
     
+    def execute_kitty_mode_pattern(self, intensity=0.5):
+        """Execute the Kitty Mode pattern directly.
+        
+        Used as the fallback when a cat-reactive pattern has no cat to react to.
+        
+        Args:
+            intensity: Pattern intensity (0.1-1.0)
+            
+        Returns:
+            bool: True if pattern executed successfully
+        """
+        self._execute_pattern_class(PATTERN_CLASSES["Kitty Mode"], intensity)
+        return True
+    
+    def stop_pattern(self):
+        """Mark the running pattern as stopped."""
+        self.pattern_active = False
+    
+    def _build_dispatch(self):
+        """Build the pattern name to handler lookup table."""
+        self._dispatch = {
+            name: partial(self._execute_pattern_class, pattern_class)
+            for name, pattern_class in PATTERN_CLASSES.items()
+        }
+        
+        # Cat-reactive patterns are only available once a detector is set
+        if self.cat_reactive_patterns:
+            self._dispatch.update({
+                "Cat Following": self.cat_reactive_patterns.execute_cat_following_pattern,
+                "Cat Teasing": self.cat_reactive_patterns.execute_cat_teasing_pattern,
+                "Cat Enrichment": self.cat_reactive_patterns.execute_cat_enrichment_pattern,
+            })
+    
+    def _execute_pattern_class(self, pattern_class, intensity):
+        """Create and execute a pattern from its class."""
+        pattern = pattern_class(self, self.time_unit_ms)
+        pattern.execute(intensity)
+    
     def set_cat_detector(self, cat_detector):
         """Set a cat detector for cat-reactive patterns.
         
@@ -153,4 +226,5 @@ class PatternExecutor:
         if self.cat_detector:
             # Import here to avoid circular imports
             from modules.vision.cat_patterns import CatReactivePatterns
-            self.cat_reactive_patterns = CatReactivePatterns(self, self.cat_detector, self.logger)
\ No newline at end of file
+            self.cat_reactive_patterns = CatReactivePatterns(self, self.cat_detector, self.logger)
+            self._build_dispatch()
\ No newline at end of file
@@ -4,12 +4,59 @@ UI Components Module for PetCube Helper
 This module contains UI creation and management functions for the PetCube Helper.
 """
 
+import io
 import os
+import queue
+import time
 import tkinter as tk
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import ttk, scrolledtext, messagebox, filedialog
-from PIL import Image, ImageTk, ImageDraw
+from PIL import Image, ImageTk, ImageDraw, ImageFont
+
+# Semi-transparent red for the excluded areas
+_OVERLAY_COLOR = (255, 0, 0, 128)
 
 class PetCubeHelperUI:
+        # Number of rendered screenshots to keep for redraws
+        _SCREENSHOT_CACHE_SIZE = 8
+        
+        # Log lines to keep, and how far past that to go before trimming
+        _LOG_MAX_LINES = 5000
+        _LOG_TRIM_SLACK = 500
+        
+        # Label fonts to try, in order, before Pillow's built-in font
+        _FONT_FILES = ("arial.ttf", "DejaVuSans.ttf")
+        
+        # Milliseconds between checks for screenshot updates from other threads
+        _SCREENSHOT_POLL_MS = 50
+        
+        # Shortest time between drag rectangle redraws (about 60 Hz)
+        _DRAG_UPDATE_INTERVAL = 1 / 60
+        
+        # Extended pattern list including cat-reactive patterns
+        _PATTERN_OPTIONS = (
+                "Kitty Mode", 
+                "Laser Pointer", 
+                "Random", 
+                "Circular", 
+                "Fixed Points",
+                "Cat Following",  # Cat-reactive patterns
+                "Cat Teasing",
+                "Cat Enrichment",
+        )
+        
+        # Detection model choices
+        _MODEL_OPTIONS = ("Default", "Custom")
+        
+        # Safe zone entries as (row, column, label, variable attribute, default %)
+        _SAFE_ZONE_FIELDS = (
+                (0, 1, "Left %:", 'min_x_var', "30"),
+                (0, 3, "Right %:", 'max_x_var', "70"),
+                (1, 1, "Top %:", 'min_y_var', "50"),
+                (1, 3, "Bottom %:", 'max_y_var', "90"),
+        )
+        
         def __init__(self, root, callback_manager, logger=None):
                 """Initialize the UI components.
                 
@@ -35,6 +82,70 @@ class PetCubeHelperUI:
                 self.photo = None
                 self.cat_detection_photo = None
                 
+                # Last values pushed to the status bar and buttons, to skip no-op updates
+                self._last_status = None
+                self._launch_enabled = None
+                self._pattern_buttons_enabled = None
+                
+                # Rendered screenshots (PhotoImage, display size, original size),
+                # most recently used last
+                self._screenshot_cache = OrderedDict()
+                
+                # Last decoded screenshot, reused when only the overlay changes
+                self._source_image = None
+                self._source_image_key = None
+                
+                # Last screenshot fitted to the canvas without the overlay, reused
+                # when only the safe zone changes
+                self._base_image = None
+                self._base_image_key = None
+                
+                # Pre-rendered overlay labels keyed by (text, color)
+                self._label_sprites = {}
+                self._font_cache = {}
+                
+                # Overlay color sized to the current preview
+                self._red_wash = None
+                
+                # Last safe zone coordinates on the preview, as (inputs, coordinates)
+                self._zone_coord_cache = (None, None)
+                
+                # Pending screenshot redraw scheduled with root.after
+                self._redraw_after_id = None
+                
+                # Screenshot updates, which may come from worker threads, waiting to be
+                # scheduled on the Tk thread by _poll_screenshot_requests
+                self._screenshot_requests = queue.Queue()
+                
+                # Screenshots and detection images are decoded and rendered on a
+                # single worker thread
+                self._render_pool = ThreadPoolExecutor(max_workers=1)
+                self._render_future = None
+                self._detection_future = None
+                
+                # Canvas item showing the screenshot, reused across redraws, and the
+                # cache key of what it currently shows
+                self._canvas_image_id = None
+                self._shown_screenshot_key = None
+                
+                # Canvas item showing the detection image, and the file, modification
+                # time, size and canvas size of the image it shows
+                self._detection_image_id = None
+                self._shown_detection_key = None
+                
+                # Latest detection image received before its tab was built
+                self._pending_detection_image = None
+                
+                # Screenshot updates are held back while their tab is hidden
+                self._screenshot_tab_visible = True
+                self._pending_screenshot = None
+                
+                # Arguments of the latest screenshot update, for refitting on resize,
+                # and the screenshot canvas size kept current by <Configure>
+                self._last_screenshot_args = None
+                self._canvas_width = 1
+                self._canvas_height = 1
+                
                 # Screen dimensions and safe zone
                 self.screen_width = 1080  # Default
                 self.screen_height = 1920  # Default
@@ -49,6 +160,7 @@ class PetCubeHelperUI:
                 self.drag_rect = None
                 self.drag_start_x = 0
                 self.drag_start_y = 0
+                self._last_drag_update = 0.0  # time.monotonic() of the last drag redraw
                 self.display_width = 0
                 self.display_height = 0
                 self.display_offset_x = 0
@@ -58,6 +170,9 @@ class PetCubeHelperUI:
                 
                 # Create UI elements
                 self.create_ui()
+                
+                # Start handing screenshot updates over to the Tk thread
+                self._poll_screenshot_requests()
         
         def log(self, message):
                 """Log a message using the provided logger function."""
@@ -131,35 +246,17 @@ class PetCubeHelperUI:
                 safe_zone_frame = ttk.LabelFrame(parent, text="Safe Zone Configuration", padding="5")
                 safe_zone_frame.pack(fill=tk.X, padx=5, pady=5)
                 
-                # X range (horizontal)
-                ttk.Label(safe_zone_frame, text="Horizontal Range:").grid(row=0, column=0, padx=5, pady=5)
+                # Range labels and boundary entries, one row per axis
+                for row, text in enumerate(("Horizontal Range:", "Vertical Range:")):
+                        ttk.Label(safe_zone_frame, text=text).grid(row=row, column=0, padx=5, pady=5)
                 
-                # Min X (left boundary)
-                ttk.Label(safe_zone_frame, text="Left %:").grid(row=0, column=1, padx=5, pady=5)
-                self.min_x_var = tk.StringVar(value="30")
-                min_x_entry = ttk.Entry(safe_zone_frame, textvariable=self.min_x_var, width=5)
-                min_x_entry.grid(row=0, column=2, padx=5, pady=5)
-                
-                # Max X (right boundary)
-                ttk.Label(safe_zone_frame, text="Right %:").grid(row=0, column=3, padx=5, pady=5)
-                self.max_x_var = tk.StringVar(value="70")
-                max_x_entry = ttk.Entry(safe_zone_frame, textvariable=self.max_x_var, width=5)
-                max_x_entry.grid(row=0, column=4, padx=5, pady=5)
-                
-                # Y range (vertical)
-                ttk.Label(safe_zone_frame, text="Vertical Range:").grid(row=1, column=0, padx=5, pady=5)
-                
-                # Min Y (top boundary)
-                ttk.Label(safe_zone_frame, text="Top %:").grid(row=1, column=1, padx=5, pady=5)
-                self.min_y_var = tk.StringVar(value="50")
-                min_y_entry = ttk.Entry(safe_zone_frame, textvariable=self.min_y_var, width=5)
-                min_y_entry.grid(row=1, column=2, padx=5, pady=5)
-                
-                # Max Y (bottom boundary)
-                ttk.Label(safe_zone_frame, text="Bottom %:").grid(row=1, column=3, padx=5, pady=5)
-                self.max_y_var = tk.StringVar(value="90")
-                max_y_entry = ttk.Entry(safe_zone_frame, textvariable=self.max_y_var, width=5)
-                max_y_entry.grid(row=1, column=4, padx=5, pady=5)
+                for row, column, text, attr, default in self._SAFE_ZONE_FIELDS:
+                        ttk.Label(safe_zone_frame, text=text).grid(row=row, column=column, padx=5, pady=5)
+                        var = tk.StringVar(value=default)
+                        setattr(self, attr, var)
+                        ttk.Entry(safe_zone_frame, textvariable=var, width=5).grid(
+                                row=row, column=column + 1, padx=5, pady=5
+                        )
                 
                 # Update and Save buttons
                 self.update_zone_button = ttk.Button(safe_zone_frame, text="Update Safe Zone", 
@@ -186,20 +283,8 @@ class PetCubeHelperUI:
                 ttk.Label(pattern_frame, text="Primary Pattern:").grid(row=0, column=0, padx=5, pady=5)
                 self.pattern_var = tk.StringVar(value="Kitty Mode")
                 
-                # Extended pattern list including cat-reactive patterns
-                pattern_options = [
-                        "Kitty Mode", 
-                        "Laser Pointer", 
-                        "Random", 
-                        "Circular", 
-                        "Fixed Points",
-                        "Cat Following",  # New cat-reactive patterns
-                        "Cat Teasing",
-                        "Cat Enrichment"
-                ]
-                
                 pattern_combo = ttk.Combobox(pattern_frame, textvariable=self.pattern_var, 
-                                                                   values=pattern_options, 
+                                                                   values=self._PATTERN_OPTIONS, 
                                                                    state="readonly", width=15)
                 pattern_combo.grid(row=0, column=1, padx=5, pady=5)
                 
@@ -270,24 +355,46 @@ class PetCubeHelperUI:
                                                                                                    command=self.callbacks.capture_screenshot)
                 self.capture_screenshot_button.pack(side=tk.LEFT, padx=5)
                 
-                # Canvas for displaying screenshot
-                self.screenshot_canvas = tk.Canvas(screenshot_frame, bg="black")
-                self.screenshot_canvas.pack(fill=tk.BOTH, expand=True)
-                self.screenshot_canvas.bind("<ButtonPress-1>", self.start_safe_zone_drag)
-                self.screenshot_canvas.bind("<B1-Motion>", self.safe_zone_dragging)
-                self.screenshot_canvas.bind("<ButtonRelease-1>", self.end_safe_zone_drag)
-                
-                # Cat Detection tab
+                # Cat Detection and Settings tabs
                 cat_detection_frame = ttk.Frame(notebook, padding="5")
                 notebook.add(cat_detection_frame, text="Cat Detection")
+                settings_frame = ttk.Frame(notebook, padding="5")
+                notebook.add(settings_frame, text="Settings")
                 
+                # Variables behind the tab widgets are created up front so settings can
+                # be loaded into them before the tabs are built
+                self.sensitivity_var = tk.DoubleVar(value=0.5)  # 0.0 to 1.0
+                self.detection_interval_var = tk.StringVar(value="0.5")
+                self.confidence_threshold_var = tk.StringVar(value="0.5")
+                self.model_var = tk.StringVar(value="Default")
+                self.model_path_var = tk.StringVar()
+                self.lead_distance_var = tk.StringVar(value="150")
+                self.tease_distance_var = tk.StringVar(value="200")
+                
+                # Tab contents other than the log are built the first time each tab is
+                # shown, and the screenshot is only redrawn while its tab is showing
+                self.screenshot_canvas = None
+                self.detection_canvas = None
+                self.notebook = notebook
+                self.screenshot_frame = screenshot_frame
+                self.cat_detection_frame = cat_detection_frame
+                self.settings_frame = settings_frame
+                self._tab_builders = {
+                        str(screenshot_frame): self.create_screenshot_canvas,
+                        str(cat_detection_frame): self.create_cat_detection_tab,
+                        str(settings_frame): self.create_settings_tab,
+                }
+                notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
+                self.on_tab_changed()
+        
+        def create_cat_detection_tab(self):
+                """Create the contents of the cat detection tab."""
                 # Cat detection controls
-                controls_frame = ttk.Frame(cat_detection_frame)
+                controls_frame = ttk.Frame(self.cat_detection_frame)
                 controls_frame.pack(fill=tk.X, padx=5, pady=5)
                 
                 # Detection sensitivity
                 ttk.Label(controls_frame, text="Detection Sensitivity:").grid(row=0, column=0, padx=5, pady=5)
-                self.sensitivity_var = tk.DoubleVar(value=0.5)  # 0.0 to 1.0
                 sensitivity_slider = ttk.Scale(controls_frame, from_=0.1, to=1.0, orient="horizontal",
                                                                         variable=self.sensitivity_var, length=200,
                                                                         command=self.callbacks.update_detection_sensitivity)
@@ -299,40 +406,39 @@ class PetCubeHelperUI:
                 self.capture_button.grid(row=0, column=2, padx=5, pady=5)
                 
                 # Canvas for displaying cat detection visualization
-                self.detection_canvas = tk.Canvas(cat_detection_frame, bg="black")
+                self.detection_canvas = tk.Canvas(self.cat_detection_frame, bg="black")
                 self.detection_canvas.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
                 
-                # Settings tab
-                settings_frame = ttk.Frame(notebook, padding="5")
-                notebook.add(settings_frame, text="Settings")
-                
+                # Show the latest detection image that arrived before the tab was built
+                if self._pending_detection_image is not None:
+                        filename, self._pending_detection_image = self._pending_detection_image, None
+                        self.update_detection_image(filename)
+        
+        def create_settings_tab(self):
+                """Create the contents of the settings tab."""
                 # Vision settings
-                vision_settings = ttk.LabelFrame(settings_frame, text="Cat Detection Settings", padding="5")
+                vision_settings = ttk.LabelFrame(self.settings_frame, text="Cat Detection Settings", padding="5")
                 vision_settings.pack(fill=tk.X, padx=5, pady=5)
                 
                 # Detection interval
                 ttk.Label(vision_settings, text="Detection Interval (sec):").grid(row=0, column=0, padx=5, pady=5)
-                self.detection_interval_var = tk.StringVar(value="0.5")
                 detection_interval_entry = ttk.Entry(vision_settings, textvariable=self.detection_interval_var, width=5)
                 detection_interval_entry.grid(row=0, column=1, padx=5, pady=5)
                 
                 # Confidence threshold
                 ttk.Label(vision_settings, text="Confidence Threshold:").grid(row=0, column=2, padx=5, pady=5)
-                self.confidence_threshold_var = tk.StringVar(value="0.5")
                 confidence_threshold_entry = ttk.Entry(vision_settings, textvariable=self.confidence_threshold_var, width=5)
                 confidence_threshold_entry.grid(row=0, column=3, padx=5, pady=5)
                 
                 # Model selection
                 ttk.Label(vision_settings, text="Detection Model:").grid(row=1, column=0, padx=5, pady=5)
-                self.model_var = tk.StringVar(value="Default")
                 model_combo = ttk.Combobox(vision_settings, textvariable=self.model_var, 
-                                                                  values=["Default", "Custom"], 
+                                                                  values=self._MODEL_OPTIONS, 
                                                                   state="readonly", width=15)
                 model_combo.grid(row=1, column=1, padx=5, pady=5)
                 
                 # Custom model path
                 ttk.Label(vision_settings, text="Custom Model Path:").grid(row=1, column=2, padx=5, pady=5)
-                self.model_path_var = tk.StringVar()
                 model_path_entry = ttk.Entry(vision_settings, textvariable=self.model_path_var, width=30)
                 model_path_entry.grid(row=1, column=3, padx=5, pady=5)
                 
@@ -346,18 +452,16 @@ class PetCubeHelperUI:
                 apply_button.grid(row=2, column=0, columnspan=5, padx=5, pady=10)
                 
                 # Reactive pattern settings
-                pattern_settings = ttk.LabelFrame(settings_frame, text="Reactive Pattern Settings", padding="5")
+                pattern_settings = ttk.LabelFrame(self.settings_frame, text="Reactive Pattern Settings", padding="5")
                 pattern_settings.pack(fill=tk.X, padx=5, pady=5)
                 
                 # Lead distance for cat following
                 ttk.Label(pattern_settings, text="Lead Distance (px):").grid(row=0, column=0, padx=5, pady=5)
-                self.lead_distance_var = tk.StringVar(value="150")
                 lead_distance_entry = ttk.Entry(pattern_settings, textvariable=self.lead_distance_var, width=5)
                 lead_distance_entry.grid(row=0, column=1, padx=5, pady=5)
                 
                 # Tease distance
                 ttk.Label(pattern_settings, text="Tease Distance (px):").grid(row=0, column=2, padx=5, pady=5)
-                self.tease_distance_var = tk.StringVar(value="200")
                 tease_distance_entry = ttk.Entry(pattern_settings, textvariable=self.tease_distance_var, width=5)
                 tease_distance_entry.grid(row=0, column=3, padx=5, pady=5)
                 
@@ -412,6 +516,10 @@ class PetCubeHelperUI:
                 Args:
                         enabled: Boolean indicating whether to enable the button
                 """
+                if enabled == self._launch_enabled:
+                        return
+                self._launch_enabled = enabled
+                
                 state = tk.NORMAL if enabled else tk.DISABLED
                 self.launch_button.config(state=state)
         
@@ -422,6 +530,10 @@ class PetCubeHelperUI:
                         start_enabled: Boolean indicating whether to enable the start button
                         stop_enabled: Boolean indicating whether to enable the stop button
                 """
+                if (start_enabled, stop_enabled) == self._pattern_buttons_enabled:
+                        return
+                self._pattern_buttons_enabled = (start_enabled, stop_enabled)
+                
                 self.start_pattern_button.config(state=tk.NORMAL if start_enabled else tk.DISABLED)
                 self.stop_pattern_button.config(state=tk.NORMAL if stop_enabled else tk.DISABLED)
         
@@ -431,16 +543,25 @@ class PetCubeHelperUI:
                 Args:
                         message: The status message to display
                 """
+                if message == self._last_status:
+                        return
+                self._last_status = message
                 self.status_var.set(message)
         
         def update_log(self, message):
                 """Add a message to the log text widget.
                 
                 Args:
-                        message: The message to add to the log
+                        message: The message to add to the log; may span several lines
                 """
                 self.log_text.config(state=tk.NORMAL)
                 self.log_text.insert(tk.END, message + "\n")
+                
+                # Keep only the newest lines, trimming in chunks rather than every insert
+                line_count = int(self.log_text.index('end-1c').split('.')[0])
+                if line_count > self._LOG_MAX_LINES + self._LOG_TRIM_SLACK:
+                        self.log_text.delete('1.0', f'{line_count - self._LOG_MAX_LINES}.0')
+                
                 self.log_text.see(tk.END)
                 self.log_text.config(state=tk.DISABLED)
         
@@ -454,118 +575,22 @@ class PetCubeHelperUI:
                         safe_zone: Dictionary with min_x, max_x, min_y, max_y keys
                         
                 Returns:
-                        bool: True if screenshot was updated successfully
+                        bool: True if the screenshot update was scheduled
                 """
                 self.screenshot_path = filename
-                self.screen_width = screen_width
-                self.screen_height = screen_height
-                self.safe_zone = safe_zone
                 
-                if not os.path.exists(filename):
+                try:
+                        st = os.stat(filename)
+                except OSError:
                         self.log(f"Screenshot file not found: {filename}")
                         return False
                 
-                try:
-                        # Clear any existing items
-                        self.screenshot_canvas.delete("all")
-                        
-                        # Open the image with PIL
-                        img = Image.open(filename)
-                        
-                        # Draw safe zone overlay on a copy of the image
-                        img_with_overlay = img.copy()
-                        draw = ImageDraw.Draw(img_with_overlay, 'RGBA')  # Ensure RGBA mode for transparency
-                        
-                        # Calculate safe zone coordinates for this image
-                        img_width, img_height = img.size
-                        zone_min_x = int(img_width * self.safe_zone['min_x'] / self.screen_width)
-                        zone_max_x = int(img_width * self.safe_zone['max_x'] / self.screen_width)
-                        zone_min_y = int(img_height * self.safe_zone['min_y'] / self.screen_height)
-                        zone_max_y = int(img_height * self.safe_zone['max_y'] / self.screen_height)
-                        
-                        # Draw semi-transparent red overlay on excluded areas (more opaque now)
-                        excluded_zones = [
-                                # Top zone (0 to zone_min_y)
-                                [(0, 0), (img_width, zone_min_y)],
-                                # Bottom zone (zone_max_y to img_height)
-                                [(0, zone_max_y), (img_width, img_height)],
-                                # Left zone (0 to zone_min_x)
-                                [(0, zone_min_y), (zone_min_x, zone_max_y)],
-                                # Right zone (zone_max_x to img_width)
-                                [(zone_max_x, zone_min_y), (img_width, zone_max_y)]
-                        ]
-                        
-                        # More visible overlay color (higher opacity)
-                        overlay_color = (255, 0, 0, 128)  # Semi-transparent red, more opaque
-                        for zone in excluded_zones:
-                                draw.rectangle(zone, fill=overlay_color)
-                        
-                        # Draw a bold green border around the safe zone
-                        border_width = 5  # Thicker border
-                        
-                        # Draw multiple rectangles for a more visible border
-                        for i in range(border_width):
-                                draw.rectangle(
-                                        [(zone_min_x + i, zone_min_y + i), (zone_max_x - i, zone_max_y - i)],
-                                        outline=(0, 255, 0),  # Bright green
-                                        width=1
-                                )
-                        
-                        # Add text labels for clarity
-                        font_size = max(12, min(img_width, img_height) // 40)  # Scale font size to image
-                        
-                        # Draw "SAFE ZONE" text at the top of the safe zone
-                        text_color = (0, 255, 0)  # Bright green
-                        draw.text(
-                                (zone_min_x + 10, zone_min_y + 10),
-                                "SAFE ZONE",
-                                fill=text_color,
-                                stroke_width=2,
-                                stroke_fill=(0, 0, 0)  # Black outline for visibility
-                        )
-                        
-                        # Draw "EXCLUDED" on each excluded zone
-                        draw.text((10, 10), "EXCLUDED AREA", fill=(255, 0, 0), stroke_width=2, stroke_fill=(0, 0, 0))
-                        draw.text((10, zone_max_y + 10), "EXCLUDED AREA", fill=(255, 0, 0), stroke_width=2, stroke_fill=(0, 0, 0))
-                        draw.text((10, zone_min_y + 10), "EXCLUDED", fill=(255, 0, 0), stroke_width=2, stroke_fill=(0, 0, 0))
-                        draw.text((zone_max_x + 10, zone_min_y + 10), "EXCLUDED", fill=(255, 0, 0), stroke_width=2, stroke_fill=(0, 0, 0))
-                        
-                        # Resize to fit canvas while maintaining aspect ratio
-                        canvas_width = self.screenshot_canvas.winfo_width()
-                        canvas_height = self.screenshot_canvas.winfo_height()
-                        
-                        # Avoid division by zero
-                        if canvas_width <= 1 or canvas_height <= 1:
-                                canvas_width = 600
-                                canvas_height = 400
-                        
-                        ratio = min(canvas_width/img_width, canvas_height/img_height)
-                        new_width = int(img_width * ratio)
-                        new_height = int(img_height * ratio)
-                        
-                        img_with_overlay = img_with_overlay.resize((new_width, new_height), Image.LANCZOS)
-                        
-                        # Convert to Tkinter PhotoImage
-                        self.photo = ImageTk.PhotoImage(img_with_overlay)
-                        
-                        # Calculate position to center the image
-                        x = (canvas_width - new_width) // 2
-                        y = (canvas_height - new_height) // 2
-                        self.display_width = new_width
-                        self.display_height = new_height
-                        self.display_offset_x = x
-                        self.display_offset_y = y
-                        self.original_width = img_width
-                        self.original_height = img_height
-                        
-                        # Add image to canvas
-                        self.screenshot_canvas.create_image(x, y, anchor=tk.NW, image=self.photo)
-                        
-                        self.log(f"Updated screenshot from {filename} with enhanced safe zone overlay")
-                        return True
-                except Exception as e:
-                        self.log(f"Error displaying screenshot: {str(e)}")
-                        return False
+                source_key = (filename, st.st_mtime_ns, st.st_size)
+                self._screenshot_requests.put((
+                        source_key, lambda: Image.open(filename), screen_width, screen_height, safe_zone,
+                        f"Updated screenshot from {filename} with enhanced safe zone overlay"
+                ))
+                return True
         
         def update_screenshot_from_data(self, image_data, screen_width, screen_height, safe_zone):
                 """Update the screenshot canvas with image data from memory.
@@ -577,139 +602,471 @@ class PetCubeHelperUI:
                         safe_zone: Dictionary with min_x, max_x, min_y, max_y keys
                         
                 Returns:
-                        bool: True if screenshot was updated successfully
+                        bool: True if the screenshot update was scheduled
                 """
                 if not image_data:
                         self.log("No screenshot data provided")
                         return False
                 
-                self.screen_width = screen_width
-                self.screen_height = screen_height
-                self.safe_zone = safe_zone
+                source_key = (None, hash(image_data))
+                self._screenshot_requests.put((
+                        source_key, lambda: Image.open(io.BytesIO(image_data)), screen_width, screen_height, safe_zone,
+                        "Updated screenshot from memory with enhanced safe zone overlay"
+                ))
+                return True
+        
+        def create_screenshot_canvas(self):
+                """Create the canvas for displaying screenshots on the screenshot tab."""
+                self.screenshot_canvas = tk.Canvas(self.screenshot_frame, bg="black")
+                self.screenshot_canvas.pack(fill=tk.BOTH, expand=True)
+                self.screenshot_canvas.bind("<ButtonPress-1>", self.start_safe_zone_drag)
+                self.screenshot_canvas.bind("<B1-Motion>", self.safe_zone_dragging)
+                self.screenshot_canvas.bind("<ButtonRelease-1>", self.end_safe_zone_drag)
+                self.screenshot_canvas.bind("<Configure>", self.on_screenshot_canvas_resized)
+        
+        def on_tab_changed(self, event=None):
+                """Build a tab's contents the first time it is shown, and track whether
+                the screenshot tab is showing and catch it up if so.
+                
+                Args:
+                        event: The Tkinter event (unused)
+                """
+                selected = self.notebook.select()
+                build_tab = self._tab_builders.pop(selected, None)
+                if build_tab is not None:
+                        build_tab()
+                
+                self._screenshot_tab_visible = selected == str(self.screenshot_frame)
+                if self._screenshot_tab_visible and self._pending_screenshot is not None:
+                        args, self._pending_screenshot = self._pending_screenshot, None
+                        self._schedule_screenshot(*args)
+        
+        def _poll_screenshot_requests(self):
+                """Schedule the latest screenshot update sent from any thread.
                 
+                Tkinter timers may only be touched from the Tk thread, so update_screenshot
+                and update_screenshot_from_data queue their updates for this poll.
+                """
+                args = None
                 try:
-                        # Clear any existing items
-                        self.screenshot_canvas.delete("all")
-                        
-                        # Open the image from memory
-                        import io
-                        img = Image.open(io.BytesIO(image_data))
+                        while True:
+                                args = self._screenshot_requests.get_nowait()
+                except queue.Empty:
+                        pass
+                
+                if args is not None:
+                        self._schedule_screenshot(*args)
+                self.root.after(self._SCREENSHOT_POLL_MS, self._poll_screenshot_requests)
+        
+        def _schedule_screenshot(self, *args, delay=30):
+                """Schedule a screenshot redraw, replacing any redraw still pending.
+                
+                Back-to-back updates collapse into a single redraw of the latest one.
+                While the screenshot tab is hidden only the latest update is kept,
+                and it is drawn once the tab is shown again. Only call this on the Tk
+                thread.
+                
+                Args:
+                        *args: Arguments for _redraw_screenshot
+                        delay: Milliseconds to wait for further updates before redrawing
+                """
+                self._last_screenshot_args = args
+                if not self._screenshot_tab_visible:
+                        self._pending_screenshot = args
+                        return
+                
+                if self._redraw_after_id is not None:
+                        self.root.after_cancel(self._redraw_after_id)
+                self._redraw_after_id = self.root.after(delay, self._redraw_screenshot, *args)
+        
+        def on_screenshot_canvas_resized(self, event=None):
+                """Record the new canvas size and refit the current screenshot once
+                the canvas stops resizing.
+                
+                Args:
+                        event: The Tkinter <Configure> event
+                """
+                if event is not None:
+                        self._canvas_width = event.width
+                        self._canvas_height = event.height
+                
+                if self._last_screenshot_args is not None:
+                        # Refits are not logged, the screenshot itself hasn't changed
+                        self._schedule_screenshot(*self._last_screenshot_args[:-1], None, delay=50)
+        
+        def _redraw_screenshot(self, source_key, open_image, screen_width, screen_height, safe_zone, message):
+                """Run a scheduled screenshot redraw.
+                
+                Screenshots that are already rendered are shown straight away. Anything
+                else is decoded and rendered on the worker thread, then picked up by
+                _poll_screenshot.
+                
+                Args:
+                        source_key: Hashable key identifying the screenshot contents
+                        open_image: Function returning the screenshot as a PIL image
+                        screen_width: The screen width in pixels
+                        screen_height: The screen height in pixels
+                        safe_zone: Dictionary with min_x, max_x, min_y, max_y keys
+                        message: Message to log once the screenshot is displayed, if any
+                """
+                self._redraw_after_id = None
+                
+                # The screenshot is fitted to the current canvas size, as last
+                # reported by <Configure>
+                canvas_width = self._canvas_width
+                canvas_height = self._canvas_height
+                
+                # Avoid division by zero
+                if canvas_width <= 1 or canvas_height <= 1:
+                        canvas_width = 600
+                        canvas_height = 400
+                
+                key = source_key + (canvas_width, canvas_height, screen_width, screen_height,
+                                    tuple(sorted(safe_zone.items())))
+                
+                # Nothing to do if this exact screenshot is already showing
+                if key == self._shown_screenshot_key:
+                        self._render_future = None
+                        return
+                
+                cached = self._screenshot_cache.get(key)
+                if cached is not None:
+                        # Drop any older render still running so it can't replace this one
+                        self._render_future = None
+                        self._screenshot_cache.move_to_end(key)
+                        self._show_screenshot(cached, canvas_width, canvas_height, screen_width, screen_height, safe_zone)
+                        self._shown_screenshot_key = key
+                        if message:
+                                self.log(message)
+                        return
+                
+                # Only the latest render is shown; older ones still running are dropped
+                self._render_future = self._render_pool.submit(
+                        self._prepare_screenshot, source_key, open_image,
+                        canvas_width, canvas_height, screen_width, screen_height, safe_zone
+                )
+                self.root.after(20, self._poll_screenshot, self._render_future, key,
+                                canvas_width, canvas_height, screen_width, screen_height, safe_zone, message)
+        
+        def _poll_screenshot(self, future, key, canvas_width, canvas_height, screen_width, screen_height, safe_zone, message):
+                """Show a screenshot once the worker thread has rendered it.
+                
+                Args:
+                        future: The Future for the _prepare_screenshot call
+                        key: Key to store the rendered screenshot under
+                        canvas_width: The canvas width the screenshot was fitted to
+                        canvas_height: The canvas height the screenshot was fitted to
+                        screen_width: The screen width in pixels
+                        screen_height: The screen height in pixels
+                        safe_zone: Dictionary with min_x, max_x, min_y, max_y keys
+                        message: Message to log once the screenshot is displayed, if any
+                """
+                if future is not self._render_future:
+                        return
+                if not future.done():
+                        self.root.after(20, self._poll_screenshot, future, key,
+                                        canvas_width, canvas_height, screen_width, screen_height, safe_zone, message)
+                        return
+                
+                self._render_future = None
+                try:
+                        img_with_overlay, source_size = future.result()
                         
-                        # Draw safe zone overlay on a copy of the image
-                        img_with_overlay = img.copy()
-                        draw = ImageDraw.Draw(img_with_overlay, 'RGBA')  # Ensure RGBA mode for transparency
+                        # Convert to Tkinter PhotoImage, which has to happen on the Tk thread
+                        cached = (ImageTk.PhotoImage(img_with_overlay), img_with_overlay.size, source_size)
+                        self._screenshot_cache[key] = cached
+                        if len(self._screenshot_cache) > self._SCREENSHOT_CACHE_SIZE:
+                                self._screenshot_cache.popitem(last=False)
                         
-                        # Calculate safe zone coordinates for this image
-                        img_width, img_height = img.size
-                        zone_min_x = int(img_width * self.safe_zone['min_x'] / self.screen_width)
-                        zone_max_x = int(img_width * self.safe_zone['max_x'] / self.screen_width)
-                        zone_min_y = int(img_height * self.safe_zone['min_y'] / self.screen_height)
-                        zone_max_y = int(img_height * self.safe_zone['max_y'] / self.screen_height)
+                        self._show_screenshot(cached, canvas_width, canvas_height, screen_width, screen_height, safe_zone)
+                        self._shown_screenshot_key = key
+                        if message:
+                                self.log(message)
+                except Exception as e:
+                        self.log(f"Error displaying screenshot: {str(e)}")
+        
+        def _prepare_screenshot(self, source_key, open_image, canvas_width, canvas_height,
+                                screen_width, screen_height, safe_zone):
+                """Decode a screenshot and render it with the safe zone overlay.
+                
+                Runs on the worker thread, which is the only thread that touches the
+                decoded and fitted image caches.
+                
+                Args:
+                        source_key: Hashable key identifying the screenshot contents
+                        open_image: Function returning the screenshot as a PIL image
+                        canvas_width: The canvas width in pixels
+                        canvas_height: The canvas height in pixels
+                        screen_width: The screen width in pixels
+                        screen_height: The screen height in pixels
+                        safe_zone: Dictionary with min_x, max_x, min_y, max_y keys
                         
-                        # Draw semi-transparent red overlay on excluded areas (more opaque now)
-                        excluded_zones = [
-                                # Top zone (0 to zone_min_y)
-                                [(0, 0), (img_width, zone_min_y)],
-                                # Bottom zone (zone_max_y to img_height)
-                                [(0, zone_max_y), (img_width, img_height)],
-                                # Left zone (0 to zone_min_x)
-                                [(0, zone_min_y), (zone_min_x, zone_max_y)],
-                                # Right zone (zone_max_x to img_width)
-                                [(zone_max_x, zone_min_y), (img_width, zone_max_y)]
-                        ]
+                Returns:
+                        tuple: The rendered image and the original screenshot size
+                """
+                # Only decode the screenshot again if it actually changed
+                if self._source_image_key != source_key:
+                        self._source_image = open_image()
+                        self._source_image.load()
+                        self._source_image_key = source_key
+                
+                # Only the overlay needs redoing if just the zone changed
+                base_key = source_key + (canvas_width, canvas_height)
+                if self._base_image_key != base_key:
+                        self._base_image = self._fit_screenshot(self._source_image, canvas_width, canvas_height)
+                        self._base_image_key = base_key
+                
+                img_with_overlay = self._render_screenshot(self._base_image, screen_width, screen_height, safe_zone)
+                return img_with_overlay, self._source_image.size
+        
+        def _show_screenshot(self, cached, canvas_width, canvas_height, screen_width, screen_height, safe_zone):
+                """Display a rendered screenshot on the screenshot canvas.
+                
+                Args:
+                        cached: Tuple of (PhotoImage, display size, original size)
+                        canvas_width: The canvas width the screenshot was fitted to
+                        canvas_height: The canvas height the screenshot was fitted to
+                        screen_width: The screen width in pixels
+                        screen_height: The screen height in pixels
+                        safe_zone: Dictionary with min_x, max_x, min_y, max_y keys
+                """
+                self.screen_width = screen_width
+                self.screen_height = screen_height
+                self.safe_zone = safe_zone
+                
+                # Clear a finished safe zone selection; the image item itself is reused
+                if self.drag_rect and not self.dragging:
+                        self.screenshot_canvas.delete(self.drag_rect)
+                        self.drag_rect = None
+                
+                self.photo, (new_width, new_height), (img_width, img_height) = cached
+                
+                # Calculate position to center the image
+                x = (canvas_width - new_width) // 2
+                y = (canvas_height - new_height) // 2
+                self.display_width = new_width
+                self.display_height = new_height
+                self.display_offset_x = x
+                self.display_offset_y = y
+                self.original_width = img_width
+                self.original_height = img_height
+                
+                # Add image to canvas, or swap the image on the existing item
+                if self._canvas_image_id is None:
+                        self._canvas_image_id = self.screenshot_canvas.create_image(x, y, anchor=tk.NW, image=self.photo)
+                else:
+                        self.screenshot_canvas.itemconfig(self._canvas_image_id, image=self.photo)
+                        self.screenshot_canvas.coords(self._canvas_image_id, x, y)
+        
+        def _fit_screenshot(self, img, canvas_width, canvas_height):
+                """Resize a screenshot to fit the canvas while maintaining aspect ratio.
+                
+                Args:
+                        img: The screenshot as a PIL image
+                        canvas_width: The canvas width in pixels
+                        canvas_height: The canvas height in pixels
                         
-                        # More visible overlay color (higher opacity)
-                        overlay_color = (255, 0, 0, 128)  # Semi-transparent red, more opaque
-                        for zone in excluded_zones:
-                                draw.rectangle(zone, fill=overlay_color)
+                Returns:
+                        Image: The resized screenshot in RGB mode
+                """
+                img_width, img_height = img.size
+                ratio = min(canvas_width/img_width, canvas_height/img_height)
+                new_width = int(img_width * ratio)
+                new_height = int(img_height * ratio)
+                
+                # The source image is cached for later redraws, so it is resized into a
+                # new image rather than thumbnailed in place. BOX averages each block of
+                # source pixels, which is the cheapest filter that doesn't alias on a
+                # large downscale.
+                img_small = img.resize((new_width, new_height), Image.BOX)
+                
+                # The resized image is already a fresh copy, so only convert it if it isn't RGB yet
+                if img_small.mode != 'RGB':
+                        img_small = img_small.convert('RGB')
+                return img_small
+        
+        def _render_screenshot(self, img_small, screen_width, screen_height, safe_zone):
+                """Draw the safe zone overlay on a screenshot that has been fitted to the canvas.
+                
+                The overlay is drawn after resizing so it only touches the displayed
+                pixels. The given image is left untouched so it can be reused.
+                
+                Args:
+                        img_small: The fitted screenshot from _fit_screenshot
+                        screen_width: The screen width in pixels
+                        screen_height: The screen height in pixels
+                        safe_zone: Dictionary with min_x, max_x, min_y, max_y keys
                         
-                        # Draw a bold green border around the safe zone
-                        border_width = 5  # Thicker border
+                Returns:
+                        Image: A copy of the screenshot with the overlay drawn on it
+                """
+                new_width, new_height = img_small.size
+                
+                # Calculate safe zone coordinates for the resized image, reusing the
+                # last ones while the inputs stay the same
+                coord_key = (new_width, new_height, screen_width, screen_height,
+                             safe_zone['min_x'], safe_zone['max_x'], safe_zone['min_y'], safe_zone['max_y'])
+                cached_key, zone_coords = self._zone_coord_cache
+                if cached_key != coord_key:
+                        zone_coords = (
+                                int(new_width * safe_zone['min_x'] / screen_width),
+                                int(new_width * safe_zone['max_x'] / screen_width),
+                                int(new_height * safe_zone['min_y'] / screen_height),
+                                int(new_height * safe_zone['max_y'] / screen_height),
+                        )
+                        self._zone_coord_cache = (coord_key, zone_coords)
+                zone_min_x, zone_max_x, zone_min_y, zone_max_y = zone_coords
+                
+                # Composite the semi-transparent red wash over the excluded areas
+                img_with_overlay = img_small.copy()
+                red_wash = self._get_red_wash(img_small.size)
+                if zone_min_y > 0:  # Top zone
+                        wash = red_wash.crop((0, 0, new_width, zone_min_y))
+                        img_with_overlay.paste(wash, (0, 0), wash)
+                if zone_max_y < new_height:  # Bottom zone
+                        wash = red_wash.crop((0, zone_max_y, new_width, new_height))
+                        img_with_overlay.paste(wash, (0, zone_max_y), wash)
+                if zone_max_y > zone_min_y:
+                        if zone_min_x > 0:  # Left zone
+                                wash = red_wash.crop((0, zone_min_y, zone_min_x, zone_max_y))
+                                img_with_overlay.paste(wash, (0, zone_min_y), wash)
+                        if zone_max_x < new_width:  # Right zone
+                                wash = red_wash.crop((zone_max_x, zone_min_y, new_width, zone_max_y))
+                                img_with_overlay.paste(wash, (zone_max_x, zone_min_y), wash)
+                
+                draw = ImageDraw.Draw(img_with_overlay)
+                
+                # Draw a bold green border around the safe zone
+                border_width = 5  # Thicker border
+                draw.rectangle(
+                        [(zone_min_x, zone_min_y), (zone_max_x, zone_max_y)],
+                        outline=(0, 255, 0),  # Bright green
+                        width=border_width
+                )
+                
+                # Add text labels for clarity
+                font_size = max(12, min(new_width, new_height) // 40)  # Scale font size to image
+                
+                # Draw "SAFE ZONE" text at the top of the safe zone
+                text_color = (0, 255, 0)  # Bright green
+                self._paste_label(img_with_overlay, (zone_min_x + 10, zone_min_y + 10), "SAFE ZONE", text_color, font_size)
+                
+                # Draw "EXCLUDED" on each excluded zone
+                self._paste_label(img_with_overlay, (10, 10), "EXCLUDED AREA", (255, 0, 0), font_size)
+                self._paste_label(img_with_overlay, (10, zone_max_y + 10), "EXCLUDED AREA", (255, 0, 0), font_size)
+                self._paste_label(img_with_overlay, (10, zone_min_y + 10), "EXCLUDED", (255, 0, 0), font_size)
+                self._paste_label(img_with_overlay, (zone_max_x + 10, zone_min_y + 10), "EXCLUDED", (255, 0, 0), font_size)
+                
+                return img_with_overlay
+        
+        def _get_red_wash(self, size):
+                """Get a semi-transparent red image of the given size, reusing the last one.
+                
+                Args:
+                        size: (width, height) of the preview image
                         
-                        # Draw multiple rectangles for a more visible border
-                        for i in range(border_width):
-                                draw.rectangle(
-                                        [(zone_min_x + i, zone_min_y + i), (zone_max_x - i, zone_max_y - i)],
-                                        outline=(0, 255, 0),  # Bright green
-                                        width=1
-                                )
+                Returns:
+                        Image: An RGBA image filled with the overlay color
+                """
+                if self._red_wash is None or self._red_wash.size != size:
+                        self._red_wash = Image.new('RGBA', size, _OVERLAY_COLOR)
+                return self._red_wash
+        
+        def _get_font(self, size):
+                """Get the label font at the given size, loading it on first use.
+                
+                Args:
+                        size: The font size in pixels
                         
-                        # Add text labels for clarity
-                        font_size = max(12, min(img_width, img_height) // 40)  # Scale font size to image
+                Returns:
+                        ImageFont: The cached font
+                """
+                font = self._font_cache.get(size)
+                if font is None:
+                        font = self._load_font(size)
+                        self._font_cache[size] = font
+                return font
+        
+        def _load_font(self, size):
+                """Load the first available label font at the given size.
+                
+                Arial is usual on Windows and DejaVu Sans on Linux. Failing both, Pillow's
+                built-in font is used, which only takes a size on Pillow 10.1 and later.
+                
+                Args:
+                        size: The font size in pixels
                         
-                        # Draw "SAFE ZONE" text at the top of the safe zone
-                        text_color = (0, 255, 0)  # Bright green
-                        draw.text(
-                                (zone_min_x + 10, zone_min_y + 10),
-                                "SAFE ZONE",
-                                fill=text_color,
+                Returns:
+                        ImageFont: The loaded font
+                """
+                for font_file in self._FONT_FILES:
+                        try:
+                                return ImageFont.truetype(font_file, size)
+                        except OSError:
+                                pass
+                
+                try:
+                        return ImageFont.load_default(size)
+                except (TypeError, AttributeError, OSError):
+                        return ImageFont.load_default()
+        
+        def _paste_label(self, img, position, text, fill, font_size):
+                """Paste a text label with a black outline onto an image.
+                
+                Outlined text is slow to rasterize, so each label is rendered once
+                and reused.
+                
+                Args:
+                        img: The PIL image to draw on
+                        position: (x, y) position of the text
+                        text: The label text
+                        fill: The text color
+                        font_size: The font size in pixels
+                """
+                key = (text, fill, font_size)
+                label = self._label_sprites.get(key)
+                if label is None:
+                        font = self._get_font(font_size)
+                        left, top, right, bottom = ImageDraw.Draw(img).textbbox((0, 0), text, font=font, stroke_width=2)
+                        sprite = Image.new('RGBA', (right - left, bottom - top))
+                        ImageDraw.Draw(sprite).text(
+                                (-left, -top),
+                                text,
+                                fill=fill,
+                                font=font,
                                 stroke_width=2,
                                 stroke_fill=(0, 0, 0)  # Black outline for visibility
                         )
-                        
-                        # Draw "EXCLUDED" on each excluded zone
-                        draw.text((10, 10), "EXCLUDED AREA", fill=(255, 0, 0), stroke_width=2, stroke_fill=(0, 0, 0))
-                        draw.text((10, zone_max_y + 10), "EXCLUDED AREA", fill=(255, 0, 0), stroke_width=2, stroke_fill=(0, 0, 0))
-                        draw.text((10, zone_min_y + 10), "EXCLUDED", fill=(255, 0, 0), stroke_width=2, stroke_fill=(0, 0, 0))
-                        draw.text((zone_max_x + 10, zone_min_y + 10), "EXCLUDED", fill=(255, 0, 0), stroke_width=2, stroke_fill=(0, 0, 0))
-                        
-                        # Resize to fit canvas while maintaining aspect ratio
-                        canvas_width = self.screenshot_canvas.winfo_width()
-                        canvas_height = self.screenshot_canvas.winfo_height()
-                        
-                        # Avoid division by zero
-                        if canvas_width <= 1 or canvas_height <= 1:
-                                canvas_width = 600
-                                canvas_height = 400
-                        
-                        ratio = min(canvas_width/img_width, canvas_height/img_height)
-                        new_width = int(img_width * ratio)
-                        new_height = int(img_height * ratio)
-                        
-                        img_with_overlay = img_with_overlay.resize((new_width, new_height), Image.LANCZOS)
-                        
-                        # Convert to Tkinter PhotoImage
-                        self.photo = ImageTk.PhotoImage(img_with_overlay)
-                        
-                        # Calculate position to center the image
-                        x = (canvas_width - new_width) // 2
-                        y = (canvas_height - new_height) // 2
-                        self.display_width = new_width
-                        self.display_height = new_height
-                        self.display_offset_x = x
-                        self.display_offset_y = y
-                        self.original_width = img_width
-                        self.original_height = img_height
-                        
-                        # Add image to canvas
-                        self.screenshot_canvas.create_image(x, y, anchor=tk.NW, image=self.photo)
-                        
-                        self.log("Updated screenshot from memory with enhanced safe zone overlay")
-                        return True
-                except Exception as e:
-                        self.log(f"Error displaying screenshot: {str(e)}")
-                        return False
+                        label = (sprite, left, top)
+                        self._label_sprites[key] = label
+                
+                sprite, left, top = label
+                img.paste(sprite, (position[0] + left, position[1] + top), sprite)
         
         def update_detection_image(self, filename):
                 """Update the cat detection canvas with the given image file.
                 
+                The image is decoded and resized on the worker thread, then shown by
+                _poll_detection_image.
+                
                 Args:
                         filename: The filename of the detection image
                         
                 Returns:
-                        bool: True if detection image was updated successfully
+                        bool: True if the detection image is showing or its update was scheduled
                 """
-                if not os.path.exists(filename):
+                # The canvas doesn't exist until the tab is first shown
+                if self.detection_canvas is None:
+                        self._pending_detection_image = filename
+                        return True
+                
+                try:
+                        st = os.stat(filename)
+                except OSError:
                         self.log(f"Detection image file not found: {filename}")
                         return False
                 
                 try:
-                        # Clear any existing items
-                        self.detection_canvas.delete("all")
-                        
-                        # Open the image with PIL
-                        img = Image.open(filename)
-                        
                         # Resize to fit canvas while maintaining aspect ratio
                         canvas_width = self.detection_canvas.winfo_width()
                         canvas_height = self.detection_canvas.winfo_height()
@@ -719,15 +1076,69 @@ class PetCubeHelperUI:
                                 canvas_width = 600
                                 canvas_height = 400
                         
-                        img_width, img_height = img.size
-                        ratio = min(canvas_width/img_width, canvas_height/img_height)
-                        new_width = int(img_width * ratio)
-                        new_height = int(img_height * ratio)
+                        # Nothing to do if this image is already showing at this size
+                        key = (filename, st.st_mtime_ns, st.st_size, canvas_width, canvas_height)
+                        if key == self._shown_detection_key:
+                                self._detection_future = None
+                                return True
+                        
+                        self._detection_future = self._render_pool.submit(
+                                self._prepare_detection_image, filename, canvas_width, canvas_height
+                        )
+                        self.root.after(20, self._poll_detection_image, self._detection_future, key,
+                                        canvas_width, canvas_height, filename)
+                        return True
+                except Exception as e:
+                        self.log(f"Error displaying detection image: {str(e)}")
+                        return False
+        
+        def _prepare_detection_image(self, filename, canvas_width, canvas_height):
+                """Decode a detection image and fit it to the canvas.
+                
+                Runs on the worker thread.
+                
+                Args:
+                        filename: The filename of the detection image
+                        canvas_width: The canvas width in pixels
+                        canvas_height: The canvas height in pixels
                         
-                        img_resized = img.resize((new_width, new_height), Image.LANCZOS)
+                Returns:
+                        tuple: The resized image and the original image size
+                """
+                # Open the image with PIL
+                img = Image.open(filename)
+                
+                # The image is only used here, so shrink it in place. thumbnail() lets
+                # JPEG files decode at reduced size via draft(), and reducing_gap does
+                # a cheap box reduce before the final BILINEAR pass.
+                original_size = img.size
+                img.thumbnail((canvas_width, canvas_height), Image.BILINEAR, reducing_gap=2.0)
+                return img, original_size
+        
+        def _poll_detection_image(self, future, key, canvas_width, canvas_height, filename):
+                """Show a detection image once the worker thread has prepared it.
+                
+                Args:
+                        future: The Future for the _prepare_detection_image call
+                        key: Key identifying the image and canvas size
+                        canvas_width: The canvas width the image was fitted to
+                        canvas_height: The canvas height the image was fitted to
+                        filename: The filename of the detection image
+                """
+                if future is not self._detection_future:
+                        return
+                if not future.done():
+                        self.root.after(20, self._poll_detection_image, future, key,
+                                        canvas_width, canvas_height, filename)
+                        return
+                
+                self._detection_future = None
+                try:
+                        img, (img_width, img_height) = future.result()
+                        new_width, new_height = img.size
                         
-                        # Convert to Tkinter PhotoImage
-                        self.cat_detection_photo = ImageTk.PhotoImage(img_resized)
+                        # Convert to Tkinter PhotoImage, which has to happen on the Tk thread
+                        self.cat_detection_photo = ImageTk.PhotoImage(img)
                         
                         # Calculate position to center the image
                         x = (canvas_width - new_width) // 2
@@ -739,14 +1150,19 @@ class PetCubeHelperUI:
                         self.original_width = img_width
                         self.original_height = img_height
                         
-                        # Add image to canvas
-                        self.detection_canvas.create_image(x, y, anchor=tk.NW, image=self.cat_detection_photo)
+                        # Add image to canvas, or swap the image on the existing item
+                        if self._detection_image_id is None:
+                                self._detection_image_id = self.detection_canvas.create_image(
+                                        x, y, anchor=tk.NW, image=self.cat_detection_photo
+                                )
+                        else:
+                                self.detection_canvas.itemconfig(self._detection_image_id, image=self.cat_detection_photo)
+                                self.detection_canvas.coords(self._detection_image_id, x, y)
                         
+                        self._shown_detection_key = key
                         self.log(f"Updated cat detection visualization from {filename}")
-                        return True
                 except Exception as e:
                         self.log(f"Error displaying detection image: {str(e)}")
-                        return False
         
         def get_pattern_settings(self):
                 """Get the current pattern settings.
@@ -838,28 +1254,31 @@ class PetCubeHelperUI:
                 """
                 try:
                         # Get values from entry fields
-                        min_x_pct = float(self.min_x_var.get()) / 100
-                        max_x_pct = float(self.max_x_var.get()) / 100
-                        min_y_pct = float(self.min_y_var.get()) / 100
-                        max_y_pct = float(self.max_y_var.get()) / 100
-                        
-                        # Validate ranges
-                        if min_x_pct >= max_x_pct:
-                                raise ValueError("Left % must be less than Right %")
-                        if min_y_pct >= max_y_pct:
-                                raise ValueError("Top % must be less than Bottom %")
-                        if min_x_pct < 0 or max_x_pct > 1 or min_y_pct < 0 or max_y_pct > 1:
-                                raise ValueError("Percentages must be between 0 and 100")
-                        
+                        min_x_pct, max_x_pct, min_y_pct, max_y_pct = (
+                                float(var.get()) / 100
+                                for var in (self.min_x_var, self.max_x_var, self.min_y_var, self.max_y_var)
+                        )
+                except ValueError as e:
+                        messagebox.showerror("Invalid Input", str(e))
+                        return None
+                
+                # Validate ranges
+                if min_x_pct >= max_x_pct:
+                        error = "Left % must be less than Right %"
+                elif min_y_pct >= max_y_pct:
+                        error = "Top % must be less than Bottom %"
+                elif min(min_x_pct, min_y_pct) < 0 or max(max_x_pct, max_y_pct) > 1:
+                        error = "Percentages must be between 0 and 100"
+                else:
                         return {
                                 'min_x': min_x_pct,
                                 'max_x': max_x_pct,
                                 'min_y': min_y_pct,
                                 'max_y': max_y_pct,
                         }
-                except ValueError as e:
-                        messagebox.showerror("Invalid Input", str(e))
-                        return None
+                
+                messagebox.showerror("Invalid Input", error)
+                return None
         
         def update_safe_zone_ui(self, safe_zone_pct):
                 """Update the safe zone UI elements with the given percentages.
@@ -892,6 +1311,11 @@ class PetCubeHelperUI:
                 """Update the drag rectangle as the mouse moves."""
                 if not self.dragging or not self.drag_rect:
                         return
+                # Motion events can arrive far faster than the canvas needs redrawing
+                now = time.monotonic()
+                if now - self._last_drag_update < self._DRAG_UPDATE_INTERVAL:
+                        return
+                self._last_drag_update = now
                 self.screenshot_canvas.coords(
                         self.drag_rect,
                         self.drag_start_x,
@@ -905,20 +1329,26 @@ class PetCubeHelperUI:
                 if not self.dragging:
                         return
                 self.dragging = False
+                # Show the final corner, which the throttled motion handler may have skipped
+                if self.drag_rect:
+                        self.screenshot_canvas.coords(
+                                self.drag_rect,
+                                self.drag_start_x,
+                                self.drag_start_y,
+                                event.x,
+                                event.y,
+                        )
                 x0 = min(self.drag_start_x, event.x)
                 x1 = max(self.drag_start_x, event.x)
                 y0 = min(self.drag_start_y, event.y)
                 y1 = max(self.drag_start_y, event.y)
                 if self.display_width == 0 or self.display_height == 0:
                         return
-                sx0 = (x0 - self.display_offset_x) / self.display_width * self.original_width
-                sx1 = (x1 - self.display_offset_x) / self.display_width * self.original_width
-                sy0 = (y0 - self.display_offset_y) / self.display_height * self.original_height
-                sy1 = (y1 - self.display_offset_y) / self.display_height * self.original_height
-                sx0 = max(0, min(self.original_width, sx0))
-                sx1 = max(0, min(self.original_width, sx1))
-                sy0 = max(0, min(self.original_height, sy0))
-                sy1 = max(0, min(self.original_height, sy1))
+                # Map canvas pixels to screenshot pixels, clamped to the screenshot
+                x_scale = self.original_width / self.display_width
+                y_scale = self.original_height / self.display_height
+                sx0, sx1 = (max(0, min(self.original_width, (x - self.display_offset_x) * x_scale)) for x in (x0, x1))
+                sy0, sy1 = (max(0, min(self.original_height, (y - self.display_offset_y) * y_scale)) for y in (y0, y1))
                 if sx1 <= sx0 or sy1 <= sy0:
                         return
                 safe_zone_pct = {
@@ -11,6 +11,14 @@ import os
 import threading
 from pathlib import Path
 
+# ONNX detectors are YOLOv5/YOLOv8 models trained on COCO, where class 15 is "cat"
+_ONNX_INPUT_SIZE = 640
+_COCO_CAT_CLASS = 15
+_NMS_THRESHOLD = 0.45
+
+# Longest side, in pixels, that frames are shrunk to before Haar detection
+_HAAR_MAX_SIDE = 480
+
 class CatDetector:
 	def __init__(self, adb_utility, logger=None):
 		"""Initialize the cat detector.
@@ -24,34 +32,68 @@ class CatDetector:
 		
 		# Detection parameters
 		self.detection_interval = 0.5  # seconds between detections
-		self.last_detection_time = 0
+		self.last_detection_time = float('-inf')  # time.monotonic() of the last detection
 		self.confidence_threshold = 0.5
 		self.detection_active = False
 		self.detection_thread = None
+		self._stop_event = threading.Event()  # Wakes the detection thread to stop
 		
 		# Cat tracking data
-		self.cat_positions = []
 		self.max_positions = 10  # Maximum number of positions to track
+		# Recent (x, y, w, h) boxes, oldest first; only the last _position_count rows are filled
+		self.cat_positions = np.zeros((self.max_positions, 4), dtype=np.int32)
+		self._position_count = 0
 		self.last_detection = None  # Last detection result (x, y, w, h)
 		
+		# Frame buffer reused for drawing debug frames, which the detection
+		# loop and manual captures can both save at once
+		self._debug_buf = None
+		self._debug_lock = threading.Lock()
+		
 		# Ensure temp directory exists
 		self.temp_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "temp")
 		os.makedirs(self.temp_dir, exist_ok=True)
 		
 		# Model will be loaded when needed
 		self.model = None
+		self.model_is_onnx = False
+		self.model_path = None  # Custom ONNX model, or None for the default search
 		self.classes = None
 	
 	def log(self, message):
 		"""Log a message using the provided logger function."""
 		self.logger(message)
 
+	def set_model_path(self, model_path):
+		"""Use a custom ONNX model, reloading the model on the next detection.
+		
+		Args:
+			model_path: Path to an ONNX model, or None for the default models
+		"""
+		if model_path != self.model_path:
+			self.model_path = model_path
+			self.model = None
+	
 	def _load_model(self):
-		"""Load the detection model."""
+		"""Load the detection model.
+		
+		A YOLO ONNX model is used when one is available, either the custom
+		model_path or models/cat_detector.onnx. Otherwise this falls back to
+		OpenCV's Haar cascades.
+		"""
 		try:
 			# Check if model files exist in expected locations
 			model_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "models")
 			
+			onnx_path = self.model_path or os.path.join(model_dir, "cat_detector.onnx")
+			if onnx_path.lower().endswith(".onnx") and os.path.exists(onnx_path):
+				self.model = cv2.dnn.readNetFromONNX(onnx_path)
+				self.model.setPreferableBackend(cv2.dnn.DNN_BACKEND_OPENCV)
+				self.model.setPreferableTarget(cv2.dnn.DNN_TARGET_CPU)
+				self.model_is_onnx = True
+				self.log(f"Loaded ONNX detection model: {onnx_path}")
+				return True
+			
 			# For now, using the default OpenCV DNN face detector as a placeholder
 			# This will be replaced with a proper cat detector model later
 			# Use OpenCV's built-in haarcascade path for compatibility
@@ -65,6 +107,7 @@ class CatDetector:
 				self.log("Found cat detection model")
 			
 			self.model = cv2.CascadeClassifier(prototxt_path)
+			self.model_is_onnx = False
 			return True
 		
 		except Exception as e:
@@ -73,9 +116,17 @@ class CatDetector:
 	
 	def get_current_frame(self):
 		"""Capture current frame from device screenshot."""
+		# Decode the screenshot straight from memory when exec-out works
+		screenshot_data = self.adb.get_screenshot_data()
+		if screenshot_data:
+			frame = cv2.imdecode(np.frombuffer(screenshot_data, np.uint8), cv2.IMREAD_COLOR)
+			if frame is not None:
+				return frame
+		
+		# Otherwise go through a file, which get_screenshot can fetch with adb pull
 		temp_file = os.path.join(self.temp_dir, "temp_frame.png")
 		
-		if self.adb.get_screenshot(temp_file):
+		if self.adb.get_screenshot(temp_file, exec_out=False):
 			try:
 				frame = cv2.imread(temp_file)
 				if frame is not None:
@@ -87,7 +138,7 @@ class CatDetector:
 	
 	def detect_cat(self, frame=None):
 		"""Detect cat in frame, returns (x, y, w, h) or None."""
-		current_time = time.time()
+		current_time = time.monotonic()
 		
 		# Limit detection frequency
 		if current_time - self.last_detection_time < self.detection_interval:
@@ -105,16 +156,29 @@ class CatDetector:
 				return None
 		
 		try:
-			# Convert to grayscale for Haar cascade
-			gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-			
-			# Detect cats using the cascade classifier
-			detections = self.model.detectMultiScale(
-				gray,
-				scaleFactor=1.1,
-				minNeighbors=5,
-				minSize=(30, 30)
-			)
+			if self.model_is_onnx:
+				detections = self._detect_onnx(frame)
+			else:
+				# Convert to grayscale for Haar cascade
+				gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+				
+				# A cat is large in the frame, so search a shrunken copy
+				scale = min(1.0, _HAAR_MAX_SIDE / max(gray.shape))
+				if scale < 1.0:
+					gray = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+				min_side = max(1, int(30 * scale))
+				
+				# Detect cats using the cascade classifier
+				detections = self.model.detectMultiScale(
+					gray,
+					scaleFactor=1.1,
+					minNeighbors=5,
+					minSize=(min_side, min_side)
+				)
+				
+				# Map the boxes back to full-frame pixels
+				if scale < 1.0 and len(detections) > 0:
+					detections = (np.asarray(detections) / scale).astype(np.int32)
 			
 			# Update detection time
 			self.last_detection_time = current_time
@@ -122,14 +186,13 @@ class CatDetector:
 			# Process detections
 			if len(detections) > 0:
 				# Take the largest detection as our cat
-				areas = [w * h for (x, y, w, h) in detections]
-				max_idx = areas.index(max(areas))
-				cat_rect = detections[max_idx]
+				areas = detections[:, 2] * detections[:, 3]
+				cat_rect = detections[int(np.argmax(areas))]
 				
-				# Update position history
-				self.cat_positions.append(cat_rect)
-				if len(self.cat_positions) > self.max_positions:
-					self.cat_positions.pop(0)
+				# Update position history, shifting out the oldest entry
+				self.cat_positions[:-1] = self.cat_positions[1:]
+				self.cat_positions[-1] = cat_rect
+				self._position_count = min(self._position_count + 1, self.max_positions)
 				
 				self.last_detection = cat_rect
 				return cat_rect
@@ -139,6 +202,43 @@ class CatDetector:
 		
 		return None
 	
+	def _detect_onnx(self, frame):
+		"""Run the ONNX model on a frame.
+		
+		Args:
+			frame: BGR frame to search
+			
+		Returns:
+			ndarray: Cat boxes as (x, y, w, h) rows in frame pixels
+		"""
+		frame_height, frame_width = frame.shape[:2]
+		blob = cv2.dnn.blobFromImage(frame, 1 / 255.0, (_ONNX_INPUT_SIZE, _ONNX_INPUT_SIZE),
+									 swapRB=True, crop=False)
+		self.model.setInput(blob)
+		output = np.squeeze(self.model.forward())
+		
+		# YOLOv8 outputs (84, N) with no objectness column; YOLOv5 outputs (N, 85)
+		if output.shape[1] not in (84, 85):
+			output = output.T
+		if output.shape[1] == 85:
+			scores = output[:, 5 + _COCO_CAT_CLASS] * output[:, 4]
+		else:
+			scores = output[:, 4 + _COCO_CAT_CLASS]
+		
+		keep = scores >= self.confidence_threshold
+		if not keep.any():
+			return np.empty((0, 4), dtype=np.int32)
+		boxes, scores = output[keep, :4], scores[keep]
+		
+		# Convert centre/size in model input space to corner/size in the frame
+		scale = np.array([frame_width, frame_height, frame_width, frame_height]) / _ONNX_INPUT_SIZE
+		boxes = boxes * scale
+		boxes[:, :2] -= boxes[:, 2:] / 2
+		boxes = boxes.astype(np.int32)
+		
+		indices = cv2.dnn.NMSBoxes(boxes.tolist(), scores.tolist(), self.confidence_threshold, _NMS_THRESHOLD)
+		return boxes[np.asarray(indices, dtype=np.int64).reshape(-1)]
+	
 	def get_cat_position(self):
 		"""Get the most recent cat position."""
 		return self.last_detection
@@ -149,20 +249,16 @@ class CatDetector:
 		Returns:
 			tuple: (dx, dy) representing movement direction, or None if insufficient data
 		"""
-		if len(self.cat_positions) < 2:
+		if self._position_count < 2:
 			return None
 		
-		# Get the two most recent positions
-		x1, y1, w1, h1 = self.cat_positions[-2]
-		x2, y2, w2, h2 = self.cat_positions[-1]
-		
-		# Calculate center points
-		center1 = (x1 + w1//2, y1 + h1//2)
-		center2 = (x2 + w2//2, y2 + h2//2)
+		# Center points of the two most recent positions, copied in one step so
+		# the detection thread can't shift them part way through
+		recent = self.cat_positions[-2:].copy()
+		centers = recent[:, :2] + recent[:, 2:] // 2
 		
 		# Calculate movement vector
-		dx = center2[0] - center1[0]
-		dy = center2[1] - center1[1]
+		dx, dy = (centers[1] - centers[0]).tolist()
 		
 		return (dx, dy)
 	
@@ -172,6 +268,7 @@ class CatDetector:
 			return
 		
 		self.detection_active = True
+		self._stop_event.clear()
 		self.detection_thread = threading.Thread(target=self._detection_loop, daemon=True)
 		self.detection_thread.start()
 		self.log("Cat detection started")
@@ -179,6 +276,7 @@ class CatDetector:
 	def stop_detection(self):
 		"""Stop the detection thread."""
 		self.detection_active = False
+		self._stop_event.set()
 		if self.detection_thread:
 			self.detection_thread.join(timeout=1.0)
 			self.detection_thread = None
@@ -187,8 +285,18 @@ class CatDetector:
 	def _detection_loop(self):
 		"""Background thread for continuous detection."""
 		while self.detection_active:
+			started = time.monotonic()
 			self.detect_cat()
-			time.sleep(0.1)  # Small sleep to prevent CPU overuse
+			
+			# Sleep until the next detection is due rather than polling; if this
+			# attempt failed before detecting, retry one interval from now
+			next_deadline = self.last_detection_time + self.detection_interval
+			if next_deadline <= started:
+				next_deadline = started + self.detection_interval
+			
+			sleep_for = next_deadline - time.monotonic()
+			if sleep_for > 0 and self._stop_event.wait(sleep_for):
+				break
 	
 	def save_debug_frame(self, frame=None, show_detection=True):
 		"""Save a debug frame with detection visualization."""
@@ -197,20 +305,24 @@ class CatDetector:
 			if frame is None:
 				return False
 		
-		# Create a copy for drawing
-		debug_frame = frame.copy()
-		
-		# Draw detection rectangle if available and requested
-		if show_detection and self.last_detection is not None:
-			x, y, w, h = self.last_detection
-			cv2.rectangle(debug_frame, (x, y), (x + w, y + h), (0, 255, 0), 2)
+		with self._debug_lock:
+			# Copy into the reused buffer for drawing
+			if self._debug_buf is None or self._debug_buf.shape != frame.shape:
+				self._debug_buf = np.empty_like(frame)
+			np.copyto(self._debug_buf, frame)
+			debug_frame = self._debug_buf
 			
-			# Label the detection
-			cv2.putText(debug_frame, "Cat", (x, y - 10), 
-						cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 0), 2)
-		
-		# Save the debug frame
-		debug_path = os.path.join(self.temp_dir, f"cat_detection_{int(time.time())}.png")
-		cv2.imwrite(debug_path, debug_frame)
+			# Draw detection rectangle if available and requested
+			if show_detection and self.last_detection is not None:
+				x, y, w, h = self.last_detection
+				cv2.rectangle(debug_frame, (x, y), (x + w, y + h), (0, 255, 0), 2)
+				
+				# Label the detection
+				cv2.putText(debug_frame, "Cat", (x, y - 10), 
+							cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 0), 2)
+			
+			# Save the debug frame
+			debug_path = os.path.join(self.temp_dir, f"cat_detection_{int(time.time())}.jpg")
+			cv2.imwrite(debug_path, debug_frame, [cv2.IMWRITE_JPEG_QUALITY, 85, cv2.IMWRITE_JPEG_OPTIMIZE, 0])
 		
 		return True
@@ -8,6 +8,46 @@ import random
 import math
 import time
 
+import numpy as np
+
+_rng = np.random.default_rng()
+
+def _next_teasing_pos(cat_x, cat_y, tease_x, tease_y, tease_distance, offset_x, offset_y):
+	"""Work out where the teasing point moves after a tap.
+	
+	Args:
+		cat_x: X coordinate of the cat's center
+		cat_y: Y coordinate of the cat's center
+		tease_x: Current teasing X coordinate
+		tease_y: Current teasing Y coordinate
+		tease_distance: Distance to keep from the cat
+		offset_x: Random X drift to use when the cat is far enough away
+		offset_y: Random Y drift to use when the cat is far enough away
+		
+	Returns:
+		tuple: The new (x, y) teasing position
+	"""
+	# Calculate vector from cat to current position
+	dx = tease_x - cat_x
+	dy = tease_y - cat_y
+	
+	# Calculate distance
+	distance = math.sqrt(dx*dx + dy*dy)
+	
+	# If cat is getting too close, move away
+	if distance < tease_distance:
+		# Normalize direction vector
+		if distance > 0:
+			ux, uy = dx/distance, dy/distance
+		else:
+			ux, uy = 1.0, 0.0  # Default direction if at same position
+		
+		# Move away from cat
+		return cat_x + int(ux * tease_distance), cat_y + int(uy * tease_distance)
+	
+	# Small random movement
+	return tease_x + offset_x, tease_y + offset_y
+
 class CatReactivePatterns:
 	def __init__(self, pattern_executor, cat_detector, logger=None):
 		"""Initialize cat-reactive pattern generator.
@@ -77,23 +117,35 @@ class CatReactivePatterns:
 			lead_x = cat_center_x + random.randint(-100, 100)
 			lead_y = cat_center_y + random.randint(-100, 100)
 		
-		# Execute pattern around lead position
-		for i in range(num_moves):
-			# Random movement around lead position
-			variation = 50 * intensity
-			tap_x = lead_x + random.randint(-int(variation), int(variation))
-			tap_y = lead_y + random.randint(-int(variation), int(variation))
+		# Local references for the tap loop
+		randint = random.randint
+		get_cat_position = self.cat_detector.get_cat_position
+		
+		# Random movement around lead position
+		variation = int(50 * intensity)
+		
+		# Delay between taps (shorter with higher intensity)
+		delay = max(0.1, 0.5 * (1.0 - intensity))
+		
+		# Execute pattern around lead position, sending the taps between each
+		# lead position update (every third tap) to the device as one sequence
+		start = 0
+		while start < num_moves:
+			end = min(num_moves, (start + 2) // 3 * 3 + 1)
 			
-			# Execute tap
-			self.pattern_executor.execute_tap(tap_x, tap_y, f"Cat-following tap {i+1}/{num_moves}")
+			steps = [
+				(lead_x + randint(-variation, variation), lead_y + randint(-variation, variation), delay, 0.0)
+				for _ in range(start, end)
+			]
 			
-			# Delay between taps (shorter with higher intensity)
-			delay = max(0.1, 0.5 * (1.0 - intensity))
-			time.sleep(delay)
+			if self.pattern_executor.log_enabled:
+				self.log(f"Cat-following taps {start + 1}-{end}/{num_moves}")
+			self.pattern_executor.execute_tap_sequence(steps)
+			start = end
 			
 			# Recalculate lead position periodically
-			if i % 3 == 0:
-				cat_pos = self.cat_detector.get_cat_position()
+			if start < num_moves:
+				cat_pos = get_cat_position()
 				if cat_pos:
 					x, y, w, h = cat_pos
 					cat_center_x = x + w//2
@@ -140,45 +192,34 @@ class CatReactivePatterns:
 		teasing_x = cat_center_x + int(math.cos(angle) * self.tease_distance)
 		teasing_y = cat_center_y + int(math.sin(angle) * self.tease_distance)
 		
+		# Local references for the tap loop
+		tap = self.pattern_executor.execute_tap
+		sleep = time.sleep
+		get_cat_position = self.cat_detector.get_cat_position
+		tease_distance = self.tease_distance
+		variation = int(30 * intensity)
+		
+		# Random drift for every tap, drawn up front
+		offsets = _rng.integers(-variation, variation + 1, size=(num_moves, 2)).tolist()
+		
+		# Delay between taps (shorter with higher intensity)
+		delay = max(0.1, 0.3 * (1.0 - intensity))
+		
 		# Execute pattern
 		for i in range(num_moves):
 			# Execute tap
-			self.pattern_executor.execute_tap(teasing_x, teasing_y, f"Cat-teasing tap {i+1}/{num_moves}")
+			tap(teasing_x, teasing_y, "Cat-teasing tap %d/%d", i + 1, num_moves)
 			
 			# Get updated cat position
-			new_cat_pos = self.cat_detector.get_cat_position()
+			new_cat_pos = get_cat_position()
 			if new_cat_pos:
 				nx, ny, nw, nh = new_cat_pos
-				new_cat_center_x = nx + nw//2
-				new_cat_center_y = ny + nh//2
-				
-				# Calculate vector from cat to current position
-				dx = teasing_x - new_cat_center_x
-				dy = teasing_y - new_cat_center_y
-				
-				# Calculate distance
-				distance = math.sqrt(dx*dx + dy*dy)
-				
-				# If cat is getting too close, move away
-				if distance < self.tease_distance:
-					# Normalize direction vector
-					if distance > 0:
-						dx, dy = dx/distance, dy/distance
-					else:
-						dx, dy = 1, 0  # Default direction if at same position
-					
-					# Move away from cat
-					teasing_x = new_cat_center_x + int(dx * self.tease_distance)
-					teasing_y = new_cat_center_y + int(dy * self.tease_distance)
-				else:
-					# Small random movement
-					variation = 30 * intensity
-					teasing_x += random.randint(-int(variation), int(variation))
-					teasing_y += random.randint(-int(variation), int(variation))
+				offset_x, offset_y = offsets[i]
+				teasing_x, teasing_y = _next_teasing_pos(
+					int(nx + nw//2), int(ny + nh//2), teasing_x, teasing_y, tease_distance, offset_x, offset_y
+				)
 			
-			# Delay between taps (shorter with higher intensity)
-			delay = max(0.1, 0.3 * (1.0 - intensity))
-			time.sleep(delay)
+			sleep(delay)
 		
 		return True
 	
@@ -207,37 +248,47 @@ class CatReactivePatterns:
 		# Number of moves based on intensity
 		num_moves = max(10, int(20 * intensity))
 		
-		# Create a pattern around the cat
-		for i in range(num_moves):
-			# Choose a random angle and distance
-			angle = random.uniform(0, 2 * math.pi)
-			min_distance = 50  # Don't go too close to the cat
-			max_distance = 200 + (100 * intensity)  # Further with higher intensity
-			distance = random.uniform(min_distance, max_distance)
+		# Local references for the tap loop
+		get_cat_position = self.cat_detector.get_cat_position
+		
+		min_distance = 50  # Don't go too close to the cat
+		max_distance = 200 + (100 * intensity)  # Further with higher intensity
+		
+		# Delay between taps (varied based on intensity)
+		pause_delay = max(0.3, 0.8 * (1.0 - intensity))  # Occasional pause to entice cat
+		move_delay = max(0.1, 0.4 * (1.0 - intensity))  # Normal movement
+		
+		# Create a pattern around the cat, sending the taps between each cat
+		# position update (every third tap) to the device as one sequence
+		start = 0
+		while start < num_moves:
+			end = min(num_moves, (start + 2) // 3 * 3 + 1)
+			count = end - start
 			
-			# Calculate position
-			tap_x = cat_center_x + int(math.cos(angle) * distance)
-			tap_y = cat_center_y + int(math.sin(angle) * distance)
+			# Choose random angles and distances for the whole batch
+			angles = _rng.uniform(0, 2 * np.pi, count)
+			distances = _rng.uniform(min_distance, max_distance, count)
 			
-			# Execute tap
-			self.pattern_executor.execute_tap(tap_x, tap_y, f"Cat-enrichment tap {i+1}/{num_moves}")
+			# Calculate positions, truncating offsets toward zero like int()
+			tap_xs = cat_center_x + (np.cos(angles) * distances).astype(np.int64)
+			tap_ys = cat_center_y + (np.sin(angles) * distances).astype(np.int64)
+			delays = np.where(_rng.random(count) < 0.3, pause_delay, move_delay)
 			
-			# Delay between taps (varied based on intensity)
-			if random.random() < 0.3:
-				# Occasional pause to entice cat
-				delay = max(0.3, 0.8 * (1.0 - intensity))
-			else:
-				# Normal movement
-				delay = max(0.1, 0.4 * (1.0 - intensity))
+			steps = [
+				(tap_x, tap_y, wait, 0.0)
+				for tap_x, tap_y, wait in zip(tap_xs.tolist(), tap_ys.tolist(), delays.tolist())
+			]
 			
-			time.sleep(delay)
+			if self.pattern_executor.log_enabled:
+				self.log(f"Cat-enrichment taps {start + 1}-{end}/{num_moves}")
+			self.pattern_executor.execute_tap_sequence(steps)
+			start = end
 			
 			# Periodically update cat position
-			if i % 3 == 0:
-				new_cat_pos = self.cat_detector.get_cat_position()
-				if new_cat_pos:
-					x, y, w, h = new_cat_pos
-					cat_center_x = x + w//2
-					cat_center_y = y + h//2
+			new_cat_pos = get_cat_position()
+			if new_cat_pos:
+				x, y, w, h = new_cat_pos
+				cat_center_x = x + w//2
+				cat_center_y = y + h//2
 		
 		return True
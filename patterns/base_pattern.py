@@ -5,10 +5,21 @@ This module provides the base class for all patterns, supporting time-unit based
 command sequences.
 """
 
-import time
 import abc
 from typing import List, Tuple, Dict, Any
 
+import numpy as np
+
+# Sin/cos lookup tables for random directions. Positions end up as integer
+# pixels, so 4096 discrete angles are more than enough resolution.
+_TRIG_LUT_SIZE = 4096
+_LUT_ANGLES = np.linspace(0, 2 * np.pi, _TRIG_LUT_SIZE, endpoint=False)
+_SIN_LUT = np.sin(_LUT_ANGLES)
+_COS_LUT = np.cos(_LUT_ANGLES)
+
+# Shared generator so each pattern instance doesn't reseed from OS entropy
+_RNG = np.random.default_rng()
+
 
 class PatternCommand:
     """Represents a single command in a pattern sequence."""
@@ -24,6 +35,9 @@ class PatternCommand:
 class BasePattern(abc.ABC):
     """Base class for all pattern implementations."""
     
+    # Random number generator for pattern randomness; draw in batches
+    rng = _RNG
+    
     def __init__(self, executor, time_unit_ms: int = 1000):
         """Initialize the base pattern.
         
@@ -83,6 +97,91 @@ class BasePattern(abc.ABC):
         """
         self.commands.append(PatternCommand("tap", x=x, y=y, relative=relative))
     
+    def hold(self, x: float, y: float, units: float, relative: bool = False):
+        """Add a hold command (press and stay still) to the pattern.
+        
+        Args:
+            x: X coordinate (0.0-1.0 if relative, pixels if absolute)
+            y: Y coordinate (0.0-1.0 if relative, pixels if absolute)
+            units: Number of time units to hold for
+            relative: If True, coordinates are relative to safe zone (0.0-1.0)
+        """
+        self.commands.append(PatternCommand("hold", x=x, y=y, units=units, relative=relative))
+    
+    def move_along(self, xs: List[float], ys: List[float], waits: List[float], relative: bool = True):
+        """Add a move and a wait command for each point of a path.
+        
+        Args:
+            xs: X coordinates of the path
+            ys: Y coordinates of the path
+            waits: Number of time units to wait at each point
+            relative: If True, coordinates are relative to safe zone (0.0-1.0)
+        """
+        self.commands.extend(
+            command
+            for x, y, units in zip(xs, ys, waits)
+            for command in (
+                PatternCommand("move", x=x, y=y, relative=relative),
+                PatternCommand("wait", units=units),
+            )
+        )
+    
+    def random_steps(self, count: int, min_distance: float, max_distance: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Generate steps in random directions with random lengths.
+        
+        Args:
+            count: Number of steps to generate
+            min_distance: Minimum step length (relative to safe zone)
+            max_distance: Maximum step length (relative to safe zone)
+            
+        Returns:
+            tuple: (dx, dy) arrays of step offsets
+        """
+        idx = self.rng.integers(0, _TRIG_LUT_SIZE, count)
+        distances = self.rng.uniform(min_distance, max_distance, count)
+        return distances * _COS_LUT[idx], distances * _SIN_LUT[idx]
+    
+    def walk_steps(self, x: float, y: float, dxs: np.ndarray, dys: np.ndarray,
+                    low: float = 0.1, high: float = 0.9) -> Tuple[List[float], List[float]]:
+        """Follow a sequence of steps, keeping each position within bounds.
+        
+        Args:
+            x: Starting X coordinate (relative to safe zone)
+            y: Starting Y coordinate (relative to safe zone)
+            dxs: Array of X step offsets
+            dys: Array of Y step offsets
+            low: Minimum allowed coordinate
+            high: Maximum allowed coordinate
+            
+        Returns:
+            tuple: (xs, ys) lists of the position after each step
+        """
+        xs = x + np.cumsum(dxs)
+        ys = y + np.cumsum(dys)
+        
+        # Clamping only changes the path once it reaches an edge, which most
+        # walks never do
+        if low <= xs.min() and xs.max() <= high and low <= ys.min() and ys.max() <= high:
+            return xs.tolist(), ys.tolist()
+        
+        xs, ys = [], []
+        for dx, dy in zip(dxs.tolist(), dys.tolist()):
+            x = max(low, min(high, x + dx))
+            y = max(low, min(high, y + dy))
+            xs.append(x)
+            ys.append(y)
+        
+        return xs, ys
+    
+    def random_direction(self) -> Tuple[float, float]:
+        """Pick a random direction.
+        
+        Returns:
+            tuple: (cos, sin) of a random angle
+        """
+        idx = self.rng.integers(0, _TRIG_LUT_SIZE)
+        return float(_COS_LUT[idx]), float(_SIN_LUT[idx])
+    
     def set_time_unit(self, milliseconds: int):
         """Set the duration of one time unit.
         
@@ -100,43 +199,73 @@ class BasePattern(abc.ABC):
         # Speed modifier based on intensity (higher intensity = faster)
         speed_modifier = 2.0 - intensity  # 1.9 to 1.0
         
-        for command in self.commands:
-            if command.command_type == "move":
-                self._execute_move(command, intensity)
-            elif command.command_type == "tap":
-                self._execute_tap(command, intensity)
-            elif command.command_type == "wait":
-                self._execute_wait(command, speed_modifier)
-    
-    def _execute_move(self, command: PatternCommand, intensity: float):
-        """Execute a move command."""
-        x, y = command.params['x'], command.params['y']
-        
-        if command.params.get('relative', False):
-            # Convert relative coordinates to absolute
-            safe_zone = self.executor.safe_zone
-            width = safe_zone['max_x'] - safe_zone['min_x']
-            height = safe_zone['max_y'] - safe_zone['min_y']
-            
-            # Scale movement based on intensity
-            x = safe_zone['min_x'] + (x * width * intensity)
-            y = safe_zone['min_y'] + (y * height * intensity)
-        
-        self.executor.execute_tap(int(x), int(y))
+        steps = self._build_tap_sequence(intensity, speed_modifier)
+        self.executor.execute_tap_sequence(steps, clamp=not self._points_in_zone(intensity))
     
-    def _execute_tap(self, command: PatternCommand, intensity: float):
-        """Execute a tap command (same as move but named differently for clarity)."""
-        self._execute_move(command, intensity)
+    def _points_in_zone(self, intensity: float) -> bool:
+        """Check whether every point is guaranteed to land inside the safe zone.
+        
+        Relative coordinates within 0.0-1.0, scaled by an intensity within
+        0.0-1.0, can never leave the safe zone, so they need no clamping.
+        """
+        if not 0 <= intensity <= 1:
+            return False
+        
+        return all(
+            command.params.get('relative', False)
+            and 0 <= command.params['x'] <= 1
+            and 0 <= command.params['y'] <= 1
+            for command in self.commands
+            if command.command_type != "wait"
+        )
     
-    def _execute_wait(self, command: PatternCommand, speed_modifier: float):
-        """Execute a wait command."""
-        wait_time = (command.params['units'] * self.time_unit_ms / 1000.0) * speed_modifier
+    def _build_tap_sequence(self, intensity: float, speed_modifier: float) -> List[Tuple[Any, Any, float, float]]:
+        """Convert the command list into (x, y, delay, hold) steps for the executor.
         
-        # Break up long waits to maintain safety timer
-        while wait_time > 0.8:
-            time.sleep(0.8)
-            self.executor.make_safety_movement()
-            wait_time -= 0.8
+        Args:
+            intensity: Pattern intensity (0.1-1.0)
+            speed_modifier: Multiplier applied to wait durations
+            
+        Returns:
+            list: (x, y, delay, hold) steps; x and y are None for a leading pause
+        """
+        # Intensity-derived scale factors are the same for every command
+        safe_zone = self.executor.safe_zone
+        origin_x, origin_y = safe_zone['min_x'], safe_zone['min_y']
+        scale_x = (safe_zone['max_x'] - origin_x) * intensity
+        scale_y = (safe_zone['max_y'] - origin_y) * intensity
+        seconds_per_unit = self.time_unit_ms / 1000.0 * speed_modifier
+        
+        def resolve_point(params):
+            """Convert move/tap/hold params into absolute screen coordinates."""
+            x, y = params['x'], params['y']
+            if params.get('relative', False):
+                # Relative coordinates scale with the safe zone and intensity
+                x = origin_x + x * scale_x
+                y = origin_y + y * scale_y
+            return int(x), int(y)
+        
+        steps = []
+        for command in self.commands:
+            command_type = command.command_type
+            if command_type in ("move", "tap"):
+                x, y = resolve_point(command.params)
+                steps.append([x, y, 0.0, 0.0])
+            elif command_type == "hold":
+                # A single long press keeps the point active for the whole hold
+                x, y = resolve_point(command.params)
+                steps.append([x, y, 0.0, command.params['units'] * seconds_per_unit])
+            elif command_type == "wait":
+                wait_time = command.params['units'] * seconds_per_unit
+                if not steps:
+                    steps.append([None, None, 0.0, 0.0])
+                
+                # Break up long waits with a re-tap to maintain safety timer
+                while wait_time > 0.8:
+                    steps[-1][2] += 0.8
+                    steps.append([steps[-1][0], steps[-1][1], 0.0, 0.0])
+                    wait_time -= 0.8
+                
+                steps[-1][2] += wait_time
         
-        if wait_time > 0:
-            time.sleep(wait_time)
+        return [tuple(step) for step in steps]
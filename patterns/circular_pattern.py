@@ -4,7 +4,7 @@ Circular Pattern for PetCube Helper
 Creates a circular movement pattern.
 """
 
-import math
+import numpy as np
 from .base_pattern import BasePattern
 
 
@@ -26,11 +26,12 @@ class CircularPattern(BasePattern):
         center_x, center_y = 0.5, 0.5
         radius = 0.4  # 40% of safe zone size
         
-        for i in range(num_points):
-            angle = 2 * math.pi * i / num_points
-            x = center_x + radius * math.cos(angle)
-            y = center_y + radius * math.sin(angle)
-            
+        # Compute all points on the circle at once
+        angles = np.linspace(0, 2 * np.pi, num_points, endpoint=False)
+        xs = center_x + radius * np.cos(angles)
+        ys = center_y + radius * np.sin(angles)
+        
+        for x, y in zip(xs.tolist(), ys.tolist()):
             # Move to point on circle
             self.move_to(x, y, relative=True)
             
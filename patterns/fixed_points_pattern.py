@@ -6,10 +6,25 @@ Moves between predefined points in a specific sequence.
 
 from .base_pattern import BasePattern
 
+# Fixed points (relative to safe zone)
+_FIXED_POINTS = (
+    (0.2, 0.3),  # Top-left
+    (0.5, 0.2),  # Top-center
+    (0.8, 0.3),  # Top-right
+    (0.8, 0.7),  # Bottom-right
+    (0.5, 0.8),  # Bottom-center
+    (0.2, 0.7),  # Bottom-left
+)
+
 
 class FixedPointsPattern(BasePattern):
     """Executes a fixed pattern of touch points."""
     
+    # The points never change, so the resolved sequence only depends on the
+    # safe zone and timing. Keep the last one around across instances.
+    _sequence_cache_key = None
+    _sequence_cache = None
+    
     def get_name(self) -> str:
         return "Fixed Points"
     
@@ -18,21 +33,26 @@ class FixedPointsPattern(BasePattern):
     
     def _setup_commands(self):
         """Setup fixed points pattern commands."""
-        # Define fixed points (relative to safe zone)
-        points = [
-            (0.2, 0.3),  # Top-left
-            (0.5, 0.2),  # Top-center
-            (0.8, 0.3),  # Top-right
-            (0.8, 0.7),  # Bottom-right
-            (0.5, 0.8),  # Bottom-center
-            (0.2, 0.7),  # Bottom-left
-        ]
-        
         # Move through points in sequence
-        for x, y in points:
+        for x, y in _FIXED_POINTS:
             self.move_to(x, y, relative=True)
             self.wait(1)
         
         # Return to center
         self.move_to(0.5, 0.5, relative=True)
         self.wait(1.5)
+    
+    def _build_tap_sequence(self, intensity, speed_modifier):
+        """Build the tap sequence, reusing the last one if inputs are unchanged."""
+        safe_zone = self.executor.safe_zone
+        key = (
+            safe_zone['min_x'], safe_zone['max_x'], safe_zone['min_y'], safe_zone['max_y'],
+            self.time_unit_ms, intensity, speed_modifier,
+        )
+        
+        cls = type(self)
+        if cls._sequence_cache_key != key:
+            cls._sequence_cache = super()._build_tap_sequence(intensity, speed_modifier)
+            cls._sequence_cache_key = key
+        
+        return cls._sequence_cache
@@ -4,8 +4,7 @@ Kitty Mode Pattern for PetCube Helper
 Special patterns optimized for cat engagement with prey-like movements.
 """
 
-import random
-import math
+import numpy as np
 from .base_pattern import BasePattern
 
 
@@ -21,122 +20,106 @@ class KittyModePattern(BasePattern):
     def _setup_commands(self):
         """Setup kitty mode pattern commands."""
         # Randomly choose a prey behavior
-        behaviors = [
-            self._prey_movement,
-            self._stalking_prey,
-            self._hiding_prey,
-            self._fleeing_prey
-        ]
-        
-        behavior = random.choice(behaviors)
-        behavior()
+        behavior = self._BEHAVIORS[self.rng.integers(len(self._BEHAVIORS))]
+        behavior(self)
     
     def _prey_movement(self):
         """Small, erratic movements like a mouse."""
         # Start position
-        x, y = random.uniform(0.3, 0.7), random.uniform(0.3, 0.7)
+        x, y = self.rng.uniform(0.3, 0.7, 2).tolist()
         self.move_to(x, y, relative=True)
         self.wait(0.3)
         
-        # Small erratic movements
-        for _ in range(15):
-            # Small movement in random direction
-            angle = random.uniform(0, 2 * math.pi)
-            distance = random.uniform(0.02, 0.08)
-            
-            x += distance * math.cos(angle)
-            y += distance * math.sin(angle)
-            
-            # Keep in bounds
-            x = max(0.1, min(0.9, x))
-            y = max(0.1, min(0.9, y))
-            
-            self.move_to(x, y, relative=True)
-            self.wait(random.uniform(0.1, 0.3))
+        # Small erratic movements in random directions
+        dxs, dys = self.random_steps(15, 0.02, 0.08)
+        xs, ys = self.walk_steps(x, y, dxs, dys)
+        self.move_along(xs, ys, self.rng.uniform(0.1, 0.3, 15).tolist())
     
     def _stalking_prey(self):
         """Slow movement followed by quick dart."""
-        x, y = random.uniform(0.2, 0.8), random.uniform(0.2, 0.8)
+        x, y = self.rng.uniform(0.2, 0.8, 2).tolist()
         self.move_to(x, y, relative=True)
         
-        for _ in range(3):
-            # Slow stalking movements
-            for _ in range(4):
-                angle = random.uniform(0, 2 * math.pi)
-                distance = random.uniform(0.01, 0.03)
-                
-                x += distance * math.cos(angle)
-                y += distance * math.sin(angle)
-                
-                x = max(0.1, min(0.9, x))
-                y = max(0.1, min(0.9, y))
-                
-                self.move_to(x, y, relative=True)
-                self.wait(0.5)
-            
-            # Quick dart!
-            angle = random.uniform(0, 2 * math.pi)
-            distance = random.uniform(0.2, 0.4)
-            
-            x += distance * math.cos(angle)
-            y += distance * math.sin(angle)
-            
-            x = max(0.1, min(0.9, x))
-            y = max(0.1, min(0.9, y))
-            
-            self.move_to(x, y, relative=True)
-            self.wait(0.1)
+        # Four slow stalking steps before each of the three darts
+        stalk_dxs, stalk_dys = self.random_steps(12, 0.01, 0.03)
+        dart_dxs, dart_dys = self.random_steps(3, 0.2, 0.4)
+        dxs = np.hstack((stalk_dxs.reshape(3, 4), dart_dxs.reshape(3, 1))).ravel()
+        dys = np.hstack((stalk_dys.reshape(3, 4), dart_dys.reshape(3, 1))).ravel()
+        xs, ys = self.walk_steps(x, y, dxs, dys)
+        
+        # Slow stalking movements, then a quick dart!
+        self.move_along(xs, ys, [0.5, 0.5, 0.5, 0.5, 0.1] * 3)
     
     def _hiding_prey(self):
         """Stop and go pattern."""
-        x, y = random.uniform(0.2, 0.8), random.uniform(0.2, 0.8)
+        x, y = self.rng.uniform(0.2, 0.8, 2).tolist()
         self.move_to(x, y, relative=True)
         
-        for _ in range(5):
-            # Hide (stay still with tiny movements)
-            for _ in range(3):
-                # Tiny jitter
-                jitter_x = x + random.uniform(-0.01, 0.01)
-                jitter_y = y + random.uniform(-0.01, 0.01)
-                self.move_to(jitter_x, jitter_y, relative=True)
-                self.wait(0.2)
+        # Freeze in place, then a dash away
+        dash_dxs, dash_dys = self.random_steps(5, 0.15, 0.35)
+        dash_xs, dash_ys = self.walk_steps(x, y, dash_dxs, dash_dys)
+        
+        for dash_x, dash_y in zip(dash_xs, dash_ys):
+            # Hide (hold still)
+            self.hold(x, y, 0.6, relative=True)
             
             # Dash away!
-            angle = random.uniform(0, 2 * math.pi)
-            distance = random.uniform(0.15, 0.35)
-            
-            x += distance * math.cos(angle)
-            y += distance * math.sin(angle)
-            
-            x = max(0.1, min(0.9, x))
-            y = max(0.1, min(0.9, y))
-            
+            x, y = dash_x, dash_y
             self.move_to(x, y, relative=True)
             self.wait(0.2)
     
     def _fleeing_prey(self):
         """Quick directional movements."""
-        x, y = random.uniform(0.2, 0.8), random.uniform(0.2, 0.8)
+        x, y = self.rng.uniform(0.2, 0.8, 2).tolist()
         self.move_to(x, y, relative=True)
         
         # Choose a general direction
-        main_angle = random.uniform(0, 2 * math.pi)
+        main_cos, main_sin = self.random_direction()
         
-        for _ in range(8):
-            # Move in generally the same direction with variation
-            angle = main_angle + random.uniform(-0.5, 0.5)
-            distance = random.uniform(0.08, 0.15)
-            
-            x += distance * math.cos(angle)
-            y += distance * math.sin(angle)
-            
-            # Bounce off edges
-            if x < 0.1 or x > 0.9:
-                main_angle = math.pi - main_angle
-                x = max(0.1, min(0.9, x))
-            if y < 0.1 or y > 0.9:
-                main_angle = -main_angle
-                y = max(0.1, min(0.9, y))
-            
-            self.move_to(x, y, relative=True)
-            self.wait(random.uniform(0.2, 0.4))
+        # Per-move deviation from the main direction, and move distances
+        offsets = self.rng.uniform(-0.5, 0.5, 8)
+        offset_cos, offset_sin = np.cos(offsets), np.sin(offsets)
+        distances = self.rng.uniform(0.08, 0.15, 8)
+        pauses = self.rng.uniform(0.2, 0.4, 8).tolist()
+        
+        # Move in generally the same direction with variation
+        # (angle addition: main_angle + offset)
+        dxs = distances * (main_cos * offset_cos - main_sin * offset_sin)
+        dys = distances * (main_sin * offset_cos + main_cos * offset_sin)
+        xs = x + np.cumsum(dxs)
+        ys = y + np.cumsum(dys)
+        
+        # Unless the prey reaches an edge and has to bounce, the whole path
+        # is just the running total of the moves
+        if 0.1 <= xs.min() and xs.max() <= 0.9 and 0.1 <= ys.min() and ys.max() <= 0.9:
+            xs, ys = xs.tolist(), ys.tolist()
+        else:
+            offset_cos, offset_sin = offset_cos.tolist(), offset_sin.tolist()
+            distances = distances.tolist()
+            xs, ys = [], []
+            for i in range(8):
+                x += distances[i] * (main_cos * offset_cos[i] - main_sin * offset_sin[i])
+                y += distances[i] * (main_sin * offset_cos[i] + main_cos * offset_sin[i])
+                
+                # Bounce off edges
+                if x < 0.1 or x > 0.9:
+                    # main_angle = pi - main_angle
+                    main_cos = -main_cos
+                    x = max(0.1, min(0.9, x))
+                if y < 0.1 or y > 0.9:
+                    # main_angle = -main_angle
+                    main_sin = -main_sin
+                    y = max(0.1, min(0.9, y))
+                
+                xs.append(x)
+                ys.append(y)
+        
+        self.move_along(xs, ys, pauses)
+    
+    # Prey behaviors to choose from, built once for the class
+    _BEHAVIORS = (
+        _prey_movement,
+        _stalking_prey,
+        _hiding_prey,
+        _fleeing_prey,
+    )
@@ -4,8 +4,6 @@ Laser Pointer Pattern for PetCube Helper
 Simulates realistic laser pointer movements with quick darts and smooth tracking.
 """
 
-import random
-import math
 from .base_pattern import BasePattern
 
 
@@ -21,8 +19,7 @@ class LaserPointerPattern(BasePattern):
     def _setup_commands(self):
         """Setup laser pointer pattern commands."""
         # Start at a random position
-        last_x = random.uniform(0.2, 0.8)
-        last_y = random.uniform(0.2, 0.8)
+        last_x, last_y = self.rng.uniform(0.2, 0.8, 2).tolist()
         
         self.move_to(last_x, last_y, relative=True)
         self.wait(0.5)
@@ -30,30 +27,29 @@ class LaserPointerPattern(BasePattern):
         # Number of movements
         num_moves = 10
         
-        for i in range(num_moves):
-            if random.random() < 0.3:
-                # Quick dart movement (30% chance)
-                new_x = random.uniform(0.1, 0.9)
-                new_y = random.uniform(0.1, 0.9)
-                
-                # Quick move with short wait
-                self.move_to(new_x, new_y, relative=True)
-                self.wait(0.2)
-            else:
-                # Smooth tracking movement
-                # Move in a direction from last position
-                angle = random.uniform(0, 2 * math.pi)
-                distance = random.uniform(0.1, 0.3)
-                
-                new_x = last_x + distance * math.cos(angle)
-                new_y = last_y + distance * math.sin(angle)
-                
-                # Clamp to valid range
-                new_x = max(0.1, min(0.9, new_x))
-                new_y = max(0.1, min(0.9, new_y))
-                
-                # Smooth move with longer wait
-                self.move_to(new_x, new_y, relative=True)
-                self.wait(random.uniform(0.5, 1.0))
-            
-            last_x, last_y = new_x, new_y
+        # Draw all randomness for the pattern up front
+        is_dart = (self.rng.random(num_moves) < 0.3).tolist()
+        dart_points = self.rng.uniform(0.1, 0.9, (num_moves, 2)).tolist()
+        step_dxs, step_dys = self.random_steps(num_moves, 0.1, 0.3)
+        smooth_waits = self.rng.uniform(0.5, 1.0, num_moves).tolist()
+        
+        # Quick darts (30% chance) jump to a new point; smooth tracking moves
+        # in a direction from the last position, so each run of smooth moves
+        # between darts is one walk
+        xs, ys = [], []
+        x, y = last_x, last_y
+        start = 0
+        for end in [i for i in range(num_moves) if is_dart[i]] + [num_moves]:
+            if end > start:
+                run_xs, run_ys = self.walk_steps(x, y, step_dxs[start:end], step_dys[start:end])
+                xs += run_xs
+                ys += run_ys
+            if end < num_moves:
+                x, y = dart_points[end]
+                xs.append(x)
+                ys.append(y)
+            start = end + 1
+        
+        # Darts get a short wait, smooth moves a longer one
+        waits = [0.2 if dart else wait for dart, wait in zip(is_dart, smooth_waits)]
+        self.move_along(xs, ys, waits)
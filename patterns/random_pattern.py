@@ -4,7 +4,6 @@ Random Pattern for PetCube Helper
 Creates random movement patterns within the safe zone.
 """
 
-import random
 from .base_pattern import BasePattern
 
 
@@ -22,13 +21,14 @@ class RandomPattern(BasePattern):
         # Number of random movements
         num_moves = 8
         
-        for i in range(num_moves):
-            # Generate random position within safe zone
-            x = random.uniform(0.1, 0.9)
-            y = random.uniform(0.1, 0.9)
-            
+        # Generate random positions within safe zone and wait times
+        # (0.5 to 2 time units) in one go
+        positions = self.rng.uniform(0.1, 0.9, (num_moves, 2)).tolist()
+        waits = self.rng.uniform(0.5, 2, num_moves).tolist()
+        
+        for (x, y), wait in zip(positions, waits):
             # Move to random position
             self.move_to(x, y, relative=True)
             
-            # Random wait time (0.5 to 2 time units)
-            self.wait(random.uniform(0.5, 2))
+            # Random wait time
+            self.wait(wait)
@@ -68,15 +68,19 @@ class PetCubeHelper:
 	
 	def poll_log_queue(self):
 		"""Poll the log queue and update the log text widget"""
+		messages = []
 		try:
 			while True:
-				message = self.log_queue.get_nowait()
-				self.ui.update_log(message)
+				messages.append(self.log_queue.get_nowait())
 				self.log_queue.task_done()
 		except queue.Empty:
 			pass
 		finally:
 			self.ui.root.after(100, self.poll_log_queue)
+		
+		# Add everything queued since the last poll in one insert
+		if messages:
+			self.ui.update_log("\n".join(messages))
 	
 	def update_ui_from_settings(self):
 		"""Update UI elements with loaded settings"""
@@ -291,7 +295,7 @@ class PetCubeHelper:
 			# Get the latest debug image
 			temp_dir = os.path.join(os.path.dirname(__file__), "temp")
 			debug_files = sorted([f for f in os.listdir(temp_dir) 
-								 if f.startswith("cat_detection_") and f.endswith(".png")],
+								 if f.startswith("cat_detection_") and f.endswith(".jpg")],
 								 reverse=True)
 			
 			if debug_files:
@@ -356,9 +360,10 @@ class PetCubeHelper:
 		
 		self.cat_detector.detection_interval = vision_settings['detection_interval']
 		self.cat_detector.confidence_threshold = vision_settings['confidence_threshold']
+		self.cat_detector.set_model_path(vision_settings['model_path'])
 		
 		# Save to config
-		self.config_manager.settings['vision_settings'] = vision_settings
+		self.config_manager.set_setting('vision_settings', vision_settings)
 		self.config_manager.save_settings()
 		
 		self.ui.set_status("Vision settings applied")
@@ -383,7 +388,7 @@ class PetCubeHelper:
 		patterns.tease_distance = pattern_config['tease_distance']
 		
 		# Save to config
-		self.config_manager.settings['pattern_config'] = pattern_config
+		self.config_manager.set_setting('pattern_config', pattern_config)
 		self.config_manager.save_settings()
 		
 		self.ui.set_status("Pattern settings applied")
@@ -394,9 +399,9 @@ class PetCubeHelper:
 		pattern_settings = self.ui.get_pattern_settings()
 		
 		# Update config with current settings
-		self.config_manager.settings['default_pattern'] = pattern_settings['pattern']
-		self.config_manager.settings['cat_detection_enabled'] = pattern_settings['cat_detection_enabled']
-		self.config_manager.settings['default_time_unit_ms'] = pattern_settings['time_unit_ms']
+		self.config_manager.set_setting('default_pattern', pattern_settings['pattern'])
+		self.config_manager.set_setting('cat_detection_enabled', pattern_settings['cat_detection_enabled'])
+		self.config_manager.set_setting('default_time_unit_ms', pattern_settings['time_unit_ms'])
 		
 		# Vision and pattern settings are saved when applied
 		
@@ -571,6 +576,9 @@ def main():
 	
 	# Start the main loop
 	root.mainloop()
+	
+	# Tear down the persistent ADB shell
+	app.adb_utility.close()
 
 
 if __name__ == "__main__":